@@ -6,28 +6,36 @@ RESTful endpoints for todo operations.
 
 Each endpoint:
 - Uses FastAPI dependency injection
-- Records metrics
 - Includes tracing
 - Returns structured responses
 """
 
 
+import base64
+import hashlib
+import json
 from datetime import datetime
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from opentelemetry.trace import SpanKind
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
+from app.core.config import redis_settings, settings
 from app.core.logging import get_logger
-from app.core.metrics import record_http_request_end, record_http_request_start
 from app.core.tracing import get_tracer
+from app.domain.todo.models import Todo
 from app.domain.todo.schemas import (
-    HealthResponse,
+    PRIORITY_ORDER,
+    RESPONSE_CACHE_VERSION,
+    Priority,
     TodoCreate,
     TodoListResponse,
     TodoResponse,
     TodoUpdate,
 )
+from app.infrastructure import redis as cache
 from app.infrastructure.db import get_db
 from app.services.todo_service import TodoService
 
@@ -36,86 +44,245 @@ router = APIRouter(prefix="/todos", tags=["todos"])
 tracer = get_tracer()
 
 
-@router.get("/", response_model=TodoListResponse)
+# List pages are cached in a namespace that TodoRepository.clear_cache
+# invalidates as a whole on every write (see cache.invalidate_namespace).
+# Its generation also guards item fills, which are stored at fixed keys.
+_LIST_CACHE_NAMESPACE = f"list:v{RESPONSE_CACHE_VERSION}"
+
+
+def _list_cache_key(**params: object) -> str:
+    """
+    Build the cache key of a list query within _LIST_CACHE_NAMESPACE.
+
+    Args:
+        **params: Query parameters identifying the page
+
+    Returns:
+        Cache key (without prefix or namespace)
+    """
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def _item_cache_key(todo_id: int) -> str:
+    """Build the cache key (without prefix) for a single todo; see TodoRepository.clear_cache."""
+    return f"item:v{RESPONSE_CACHE_VERSION}:{todo_id}"
+
+
+def _encode_cursor(todo: Todo, sort_by: str) -> str:
+    """
+    Build the opaque keyset cursor pointing just past a todo.
+
+    Args:
+        todo: Last todo of the current page
+        sort_by: Sort field of the listing
+
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(orjson.dumps([getattr(todo, sort_by), todo.id])).decode()
+
+
+def _decode_cursor(cursor: str, sort_by: str) -> tuple[Any, int]:
+    """
+    Parse a cursor from _encode_cursor back into (sort value, id).
+
+    Args:
+        cursor: Cursor from a previous response's next_cursor
+        sort_by: Sort field of the listing (must match the cursor's)
+
+    Returns:
+        (sort value, id) tuple
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        value, todo_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        if sort_by in ("created_at", "updated_at"):
+            value = datetime.fromisoformat(value)
+        elif not isinstance(value, str) or (sort_by == "priority" and value not in PRIORITY_ORDER):
+            raise ValueError(value)
+        if not isinstance(todo_id, int):
+            raise ValueError(todo_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from e
+
+    return value, todo_id
+
+
+def _etag(body: str | bytes) -> str:
+    """
+    Build a weak ETag for a serialized response body.
+
+    Weak because the compression middleware may re-encode the body on the way out.
+
+    Args:
+        body: Serialized JSON body
+
+    Returns:
+        ETag header value
+    """
+    if isinstance(body, str):
+        body = body.encode()
+    return f'W/"{hashlib.sha1(body).hexdigest()[:16]}"'
+
+
+def _json_response(request: Request, body: str | bytes) -> Response:
+    """
+    Send a serialized JSON body, or 304 if the client already has it.
+
+    Args:
+        request: HTTP request (for If-None-Match)
+        body: Serialized JSON body
+
+    Returns:
+        200 response with the body, or 304 Not Modified
+    """
+    etag = _etag(body)
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in candidates or etag.removeprefix("W/") in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _serialize_todo(todo: Todo) -> str:
+    """
+    Serialize a todo as its TodoResponse JSON.
+
+    Endpoints return the body directly, so FastAPI does not validate the
+    returned object against response_model and re-encode it a second time.
+
+    Args:
+        todo: Todo entity
+
+    Returns:
+        JSON body
+    """
+    return TodoResponse.model_validate(todo).model_dump_json()
+
+
+@router.get("", response_model=TodoListResponse)
 async def list_todos(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    sort_by: str = Query("created_at", description="Sort field"),
-    order: str = Query("desc", description="Sort order: asc or desc"),
+    sort_by: Literal["created_at", "updated_at", "priority", "title"] = Query(
+        "created_at", description="Sort field"
+    ),
+    order: Literal["asc", "desc"] = Query("desc", description="Sort order: asc or desc"),
     is_completed: bool | None = Query(None, description="Filter by completion status"),
-    priority: str | None = Query(
-        None, regex="^(low|medium|high)$", description="Filter by priority"
+    priority: Priority | None = Query(None, description="Filter by priority"),
+    cursor: str | None = Query(
+        None, description="next_cursor from the previous page; takes precedence over page"
     ),
+    exact_count: bool = Query(False, description="Count all matches instead of a bounded count"),
     session: AsyncSession = Depends(get_db),
-) -> TodoListResponse:
+) -> Response:
     """
     Get all todos with pagination and filtering.
 
     Query Parameters:
         page: Page number (default: 1)
         page_size: Items per page (default: 20, max: 100)
-        sort_by: Field to sort by (default: created_at)
+        sort_by: Field to sort by (default: created_at) - created_at, updated_at,
+            priority, title
         order: Sort order (default: desc)
         is_completed: Filter by completion status
         priority: Filter by priority (low, medium, high)
+        cursor: Keyset cursor (next_cursor of the previous page); seeks past
+            the previous page instead of using OFFSET
+        exact_count: Count every match; by default totals past
+            COUNT_LIMIT are capped or estimated (total_is_estimate)
 
     Returns:
-        Paginated list of todos
+        Paginated list of todos, serialized once and shared with the cache.
+        Honours If-None-Match with 304 Not Modified.
     """
     logger.info("Fetching todos list", page=page, page_size=page_size)
-    start_time = record_http_request_start("GET", "/api/v1/todos")
 
-    try:
-        with tracer.start_as_current_span("list_todos", kind="server") as span:
+    with tracer.start_as_current_span(
+        "list_todos", kind=SpanKind.SERVER, record_exception=False
+    ) as span:
+        if span.is_recording():
             span.set_attribute("page", page)
             span.set_attribute("page_size", page_size)
             span.set_attribute("sort_by", sort_by)
             span.set_attribute("order", order)
 
-            service = TodoService(session)
-            todos, total = await service.get_todos(
-                page=page,
-                page_size=page_size,
-                sort_by=sort_by,
-                order=order,
-                is_completed=is_completed,
-                priority=priority,
-            )
+        cache_key = _list_cache_key(
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            order=order,
+            is_completed=is_completed,
+            priority=priority,
+            cursor=cursor,
+            exact_count=exact_count,
+        )
+        generation, cached = await cache.get_raw_namespaced(_LIST_CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            logger.info("Todos served from cache")
+
+            return _json_response(request, cached)
+
+        after = _decode_cursor(cursor, sort_by) if cursor is not None else None
+
+        service = TodoService(session)
+        todos, total, total_is_estimate = await service.get_todos(
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            order=order,
+            is_completed=is_completed,
+            priority=priority,
+            after=after,
+            exact_count=exact_count,
+        )
 
+        if after is not None or total_is_estimate:
+            # The position within the result set is unknown when seeking (or
+            # the total is approximate), so a full page is assumed to be
+            # followed by another one
+            has_next = len(todos) == page_size
+            has_previous = after is not None or page > 1
+        else:
             has_next = (page * page_size) < total
             has_previous = page > 1
 
-            response = TodoListResponse(
-                items=todos,
-                total=total,
-                page=page,
-                page_size=page_size,
-                has_next=has_next,
-                has_previous=has_previous,
-            )
-
-            duration = (datetime.now() - start_time).total_seconds()
-            record_http_request_end("GET", "/api/v1/todos", status.HTTP_200_OK, duration)
-
-            logger.info("Todos fetched successfully", total=total)
-
-            return response
-
-    except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        record_http_request_end(
-            "GET", "/api/v1/todos", status.HTTP_500_INTERNAL_SERVER_ERROR, duration
+        response = TodoListResponse(
+            items=todos,
+            total=total,
+            total_is_estimate=total_is_estimate,
+            page=page,
+            page_size=page_size,
+            has_next=has_next,
+            has_previous=has_previous,
+            next_cursor=_encode_cursor(todos[-1], sort_by) if has_next and todos else None,
+        )
+        body = response.model_dump_json()
+        await cache.set_raw_namespaced(
+            _LIST_CACHE_NAMESPACE,
+            generation,
+            cache.namespaced_key(_LIST_CACHE_NAMESPACE, generation, cache_key),
+            body,
+            ttl=redis_settings.cache_ttl,
         )
 
-        logger.error("Failed to fetch todos", error=str(e))
-        raise
+        logger.info("Todos fetched successfully", total=total)
+
+        return _json_response(request, body)
 
 
 @router.get("/{todo_id}", response_model=TodoResponse)
 async def get_todo(
+    request: Request,
     todo_id: int,
     session: AsyncSession = Depends(get_db),
-) -> TodoResponse:
+) -> Response:
     """
     Get a specific todo by ID.
 
@@ -123,51 +290,47 @@ async def get_todo(
         todo_id: Todo ID
 
     Returns:
-        Todo entity
+        Todo entity. Honours If-None-Match with 304 Not Modified.
     """
     logger.info("Fetching todo", todo_id=todo_id)
 
-    start_time = record_http_request_start("GET", "/api/v1/todos/{todo_id}")
-
-    try:
-        with tracer.start_as_current_span("get_todo", kind="server") as span:
+    with tracer.start_as_current_span("get_todo", kind=SpanKind.SERVER) as span:
+        if span.is_recording():
             span.set_attribute("todo_id", todo_id)
 
-            service = TodoService(session)
-            todo = await service.get_todo(todo_id)
-
-            if not todo:
-                duration = (datetime.now() - start_time).total_seconds()
-                record_http_request_end(
-                    "GET", "/api/v1/todos/{todo_id}", status.HTTP_404_NOT_FOUND, duration
-                )
-
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Todo not found")
+        generation, cached = await cache.get_raw_with_generation(
+            _LIST_CACHE_NAMESPACE, _item_cache_key(todo_id)
+        )
+        if cached is not None:
+            logger.info("Todo served from cache", todo_id=todo_id)
 
-            duration = (datetime.now() - start_time).total_seconds()
-            record_http_request_end("GET", "/api/v1/todos/{todo_id}", status.HTTP_200_OK, duration)
+            return _json_response(request, cached)
 
-            logger.info("Todo fetched successfully", todo_id=todo_id)
+        service = TodoService(session)
+        todo = await service.get_todo(todo_id)
 
-            return todo
+        if not todo:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Todo not found")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        record_http_request_end(
-            "GET", "/api/v1/todos/{todo_id}", status.HTTP_500_INTERNAL_SERVER_ERROR, duration
+        body = _serialize_todo(todo)
+        await cache.set_raw_namespaced(
+            _LIST_CACHE_NAMESPACE,
+            generation,
+            _item_cache_key(todo_id),
+            body,
+            ttl=redis_settings.cache_ttl,
         )
 
-        logger.error("Failed to fetch todo", todo_id=todo_id, error=str(e))
-        raise
+        logger.info("Todo fetched successfully", todo_id=todo_id)
 
+        return _json_response(request, body)
 
-@router.post("/", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
+
+@router.post("", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
 async def create_todo(
     todo_data: TodoCreate,
     session: AsyncSession = Depends(get_db),
-) -> TodoResponse:
+) -> Response:
     """
     Create a new todo.
 
@@ -182,39 +345,29 @@ async def create_todo(
     """
     logger.info("Creating todo", title=todo_data.title)
 
-    start_time = record_http_request_start("POST", "/api/v1/todos")
-
-    try:
-        with tracer.start_as_current_span("create_todo", kind="server") as span:
+    with tracer.start_as_current_span("create_todo", kind=SpanKind.SERVER) as span:
+        if span.is_recording():
             span.set_attribute("title", todo_data.title)
             span.set_attribute("priority", todo_data.priority)
 
-            service = TodoService(session)
-            todo = await service.create_todo(todo_data)
-
-            duration = (datetime.now() - start_time).total_seconds()
-            record_http_request_end("POST", "/api/v1/todos", status.HTTP_201_CREATED, duration)
-
-            logger.info("Todo created successfully", todo_id=todo.id)
+        service = TodoService(session)
+        todo = await service.create_todo(todo_data)
 
-            return todo
+        logger.info("Todo created successfully", todo_id=todo.id)
 
-    except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        record_http_request_end(
-            "POST", "/api/v1/todos", status.HTTP_500_INTERNAL_SERVER_ERROR, duration
+        return Response(
+            content=_serialize_todo(todo),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json",
         )
 
-        logger.error("Failed to create todo", error=str(e))
-        raise
-
 
 @router.put("/{todo_id}", response_model=TodoResponse)
 async def update_todo(
     todo_id: int,
     todo_data: TodoUpdate,
     session: AsyncSession = Depends(get_db),
-) -> TodoResponse:
+) -> Response:
     """
     Update a todo.
 
@@ -232,40 +385,19 @@ async def update_todo(
     """
     logger.info("Updating todo", todo_id=todo_id)
 
-    start_time = record_http_request_start("PUT", "/api/v1/todos/{todo_id}")
-
-    try:
-        with tracer.start_as_current_span("update_todo", kind="server") as span:
+    with tracer.start_as_current_span("update_todo", kind=SpanKind.SERVER) as span:
+        if span.is_recording():
             span.set_attribute("todo_id", todo_id)
 
-            service = TodoService(session)
-            updated_todo = await service.update_todo(todo_id, todo_data)
+        service = TodoService(session)
+        updated_todo = await service.update_todo(todo_id, todo_data)
 
-            if not updated_todo:
-                duration = (datetime.now() - start_time).total_seconds()
-                record_http_request_end(
-                    "PUT", "/api/v1/todos/{todo_id}", status.HTTP_404_NOT_FOUND, duration
-                )
+        if not updated_todo:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Todo not found")
 
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Todo not found")
+        logger.info("Todo updated successfully", todo_id=todo_id)
 
-            duration = (datetime.now() - start_time).total_seconds()
-            record_http_request_end("PUT", "/api/v1/todos/{todo_id}", status.HTTP_200_OK, duration)
-
-            logger.info("Todo updated successfully", todo_id=todo_id)
-
-            return updated_todo
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        record_http_request_end(
-            "PUT", "/api/v1/todos/{todo_id}", status.HTTP_500_INTERNAL_SERVER_ERROR, duration
-        )
-
-        logger.error("Failed to update todo", todo_id=todo_id, error=str(e))
-        raise
+        return Response(content=_serialize_todo(updated_todo), media_type="application/json")
 
 
 @router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -284,47 +416,24 @@ async def delete_todo(
     """
     logger.info("Deleting todo", todo_id=todo_id)
 
-    start_time = record_http_request_start("DELETE", "/api/v1/todos/{todo_id}")
-
-    try:
-        with tracer.start_as_current_span("delete_todo", kind="server") as span:
+    with tracer.start_as_current_span("delete_todo", kind=SpanKind.SERVER) as span:
+        if span.is_recording():
             span.set_attribute("todo_id", todo_id)
 
-            service = TodoService(session)
-            deleted = await service.delete_todo(todo_id)
-
-            if not deleted:
-                duration = (datetime.now() - start_time).total_seconds()
-                record_http_request_end(
-                    "DELETE", "/api/v1/todos/{todo_id}", status.HTTP_404_NOT_FOUND, duration
-                )
-
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Todo not found")
+        service = TodoService(session)
+        deleted = await service.delete_todo(todo_id)
 
-            duration = (datetime.now() - start_time).total_seconds()
-            record_http_request_end(
-                "DELETE", "/api/v1/todos/{todo_id}", status.HTTP_204_NO_CONTENT, duration
-            )
-
-            logger.info("Todo deleted successfully", todo_id=todo_id)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        record_http_request_end(
-            "DELETE", "/api/v1/todos/{todo_id}", status.HTTP_500_INTERNAL_SERVER_ERROR, duration
-        )
+        if not deleted:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Todo not found")
 
-        logger.error("Failed to delete todo", todo_id=todo_id, error=str(e))
-        raise
+        logger.info("Todo deleted successfully", todo_id=todo_id)
 
 
 @router.patch("/{todo_id}/complete", response_model=TodoResponse)
 async def toggle_todo_completion(
     todo_id: int,
     session: AsyncSession = Depends(get_db),
-) -> TodoResponse:
+) -> Response:
     """
     Toggle todo completion status.
 
@@ -336,48 +445,20 @@ async def toggle_todo_completion(
     """
     logger.info("Toggling todo completion", todo_id=todo_id)
 
-    start_time = record_http_request_start("PATCH", "/api/v1/todos/{todo_id}/complete")
-
-    try:
-        with tracer.start_as_current_span("toggle_todo_completion", kind="server") as span:
+    with tracer.start_as_current_span("toggle_todo_completion", kind=SpanKind.SERVER) as span:
+        if span.is_recording():
             span.set_attribute("todo_id", todo_id)
 
-            service = TodoService(session)
-            updated_todo = await service.toggle_todo_completion(todo_id)
-
-            if not updated_todo:
-                duration = (datetime.now() - start_time).total_seconds()
-                record_http_request_end(
-                    "PATCH", "/api/v1/todos/{todo_id}/complete", status.HTTP_404_NOT_FOUND, duration
-                )
-
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Todo not found")
-
-            duration = (datetime.now() - start_time).total_seconds()
-            record_http_request_end(
-                "PATCH", "/api/v1/todos/{todo_id}/complete", status.HTTP_200_OK, duration
-            )
-
-            logger.info(
-                "Todo completion toggled successfully",
-                todo_id=todo_id,
-                is_completed=updated_todo.is_completed,
-            )
-
-            return updated_todo
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        record_http_request_end(
-            "PATCH",
-            "/api/v1/todos/{todo_id}/complete",
-            status.HTTP_500_INTERNAL_SERVER_ERROR,
-            duration,
-        )
+        service = TodoService(session)
+        updated_todo = await service.toggle_todo_completion(todo_id)
 
-        logger.error(
-            "Failed to toggle todo completion", todo_id=todo_id, error=str(e)
+        if not updated_todo:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Todo not found")
+
+        logger.info(
+            "Todo completion toggled successfully",
+            todo_id=todo_id,
+            is_completed=updated_todo.is_completed,
         )
-        raise
\ No newline at end of file
+
+        return Response(content=_serialize_todo(updated_todo), media_type="application/json")
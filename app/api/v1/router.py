@@ -5,9 +5,10 @@ API v1 Router
 Registers all v1 API routes.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.endpoints import todos
 from app.core.config import settings
@@ -15,20 +16,27 @@ from app.domain.todo.schemas import HealthResponse
 
 api_router = APIRouter()
 
+# Static part of the health payload, computed once at import
+_HEALTH_VERSION = settings.app_version
+
 # Include todo endpoints
 api_router.include_router(todos.router)
 
 
 @api_router.get("/health", response_model=HealthResponse, tags=["health"])
-async def health_check() -> HealthResponse:
+async def health_check() -> ORJSONResponse:
     """
     Health check endpoint at /api/v1/health.
 
     Returns application status and version.
     Does not touch the database — safe for liveness probes.
+    The payload is built directly (no HealthResponse validation) since
+    probes hit this every few seconds; the model still documents it.
     """
-    return HealthResponse(
-        status="healthy",
-        version=settings.app_version,
-        timestamp=datetime.now(),
+    return ORJSONResponse(
+        {
+            "status": "healthy",
+            "version": _HEALTH_VERSION,
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
     )
\ No newline at end of file
@@ -7,11 +7,19 @@ Application Configuration
 Environment variables are the source of truth for all configuration.
 """
 
+import re
 from functools import lru_cache
 
-from pydantic import Field, field_validator, model_validator
+from dotenv import load_dotenv
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Matches origins that already carry a scheme
+_has_http_scheme = re.compile(r"^https?://", re.IGNORECASE).match
+
+# Dotenv file loaded once by get_all_settings()
+ENV_FILE = ".env"
+
 
 class DatabaseSettings(BaseSettings):
     """Database connection settings."""
@@ -23,11 +31,25 @@ class DatabaseSettings(BaseSettings):
 
     pool_size: int = Field(default=10, ge=1, le=50, description="Database connection pool size")
     max_overflow: int = Field(default=20, ge=0, le=50, description="Max overflow connections")
+    pool_recycle: int = Field(
+        default=1800, ge=-1, description="Recycle pooled connections after this many seconds"
+    )
+    keepalive_interval: int = Field(
+        default=60, ge=0, description="Background pool ping interval in seconds (0 disables)"
+    )
+    query_cache_size: int = Field(
+        default=1200, ge=0, description="SQLAlchemy compiled statement cache size"
+    )
+    statement_cache_size: int = Field(
+        default=500, ge=0, description="asyncpg prepared statement cache size per connection"
+    )
+    jit: bool = Field(default=False, description="Enable PostgreSQL JIT compilation")
+    command_timeout: float = Field(
+        default=5.0, gt=0, description="Seconds before a single query is cancelled"
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="DB_",
-        env_file=".env",
-        env_file_encoding="utf-8",
         extra="ignore",
     )
 
@@ -35,17 +57,21 @@ class DatabaseSettings(BaseSettings):
 class RedisSettings(BaseSettings):
     """Redis connection settings."""
 
+    # Aliased so the variable is REDIS_URL rather than REDIS_REDIS_URL
     redis_url: str = Field(
         default="redis://localhost:6379/0",
+        validation_alias="redis_url",
         description="Redis connection URL",
     )
 
     pool_size: int = Field(default=10, ge=1, le=50, description="Redis connection pool size")
+    cache_ttl: int = Field(default=60, ge=1, description="Read cache TTL in seconds")
+    health_check_interval: int = Field(
+        default=30, ge=0, description="Seconds idle before a connection is pinged on checkout"
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="REDIS_",
-        env_file=".env",
-        env_file_encoding="utf-8",
         extra="ignore",
     )
 
@@ -68,10 +94,30 @@ class TracingSettings(BaseSettings):
     )
     otel_sampling_rate: float = Field(default=1.0, ge=0.0, le=1.0, description="OTLP sampling rate")
 
+    # BatchSpanProcessor tuning; names match the standard OTEL_BSP_* variables
+    otel_bsp_max_queue_size: int = Field(
+        default=4096, ge=1, description="Max spans buffered before dropping"
+    )
+    otel_bsp_schedule_delay: int = Field(
+        default=1000, ge=0, description="Delay between span exports in milliseconds"
+    )
+    otel_bsp_max_export_batch_size: int = Field(
+        default=256, ge=1, description="Max spans per export batch"
+    )
+    otel_bsp_export_timeout: int = Field(
+        default=10000, ge=0, description="Span export timeout in milliseconds"
+    )
+
+    # Client instrumentation adds a span to every query / command; switch off
+    # independently when per-operation spans are not worth their overhead
+    otel_instrument_sqlalchemy: bool = Field(
+        default=True, description="Create spans for SQLAlchemy queries"
+    )
+    otel_instrument_redis: bool = Field(default=True, description="Create spans for Redis commands")
+
+    # Field names already carry the otel_ prefix, so no env_prefix here
+    # (it would turn OTEL_SAMPLING_RATE into OTEL_OTEL_SAMPLING_RATE).
     model_config = SettingsConfigDict(
-        env_prefix="OTEL_",
-        env_file=".env",
-        env_file_encoding="utf-8",
         extra="ignore",
     )
 
@@ -84,11 +130,12 @@ class MetricsSettings(BaseSettings):
         default="/metrics",
         description="Prometheus metrics endpoint path",
     )
+    metrics_cache_ttl: float = Field(
+        default=1.0, ge=0, description="Seconds a rendered /metrics body is reused"
+    )
 
+    # Field names already carry the metrics_ prefix
     model_config = SettingsConfigDict(
-        env_prefix="METRICS_",
-        env_file=".env",
-        env_file_encoding="utf-8",
         extra="ignore",
     )
 
@@ -103,10 +150,8 @@ class LoggingSettings(BaseSettings):
     )
     log_trace_id: bool = Field(default=True, description="Include trace_id in logs")
 
+    # Field names already carry the log_ prefix
     model_config = SettingsConfigDict(
-        env_prefix="LOG_",
-        env_file=".env",
-        env_file_encoding="utf-8",
         extra="ignore",
     )
 
@@ -135,36 +180,74 @@ class AppSettings(BaseSettings):
     )
     rate_limit_window: int = Field(default=60, ge=1, description="Rate limit window in seconds")
 
+    # Server (uvicorn) settings, used when running ``python -m app.main``
+    host: str = Field(default="0.0.0.0", description="Bind address")
+    port: int = Field(default=8000, ge=1, le=65535, description="Bind port")
+    # Every worker opens up to pool_size + max_overflow database connections
+    # (30 by default): 3 * 30 = 90 stays under PostgreSQL's default
+    # max_connections=100
+    workers: int = Field(default=3, ge=1, description="Worker processes")
+    limit_concurrency: int | None = Field(
+        default=1000, ge=1, description="Max concurrent connections per worker before 503"
+    )
+    backlog: int = Field(default=2048, ge=1, description="Socket listen backlog")
+    timeout_keep_alive: int = Field(default=5, ge=0, description="Keep-alive timeout in seconds")
+
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         extra="ignore",
     )
 
     @field_validator("cors_origins")
     @classmethod
     def validate_cors_origins(cls, v: list[str]) -> list[str]:
-        """Validate CORS origins."""
-        result = []
-        for origin in v:
-            if origin == "*":
-                result.append(origin)
-            elif origin.startswith(("http://", "https://")):
-                result.append(origin)
-            else:
-                result.append(f"https://{origin}")
-        return result
-
-    @model_validator(mode="after")
-    def set_debug_from_env(self) -> "AppSettings":
-        """Set debug mode from environment."""
-        import os
-
-        self.debug = os.getenv("DEBUG", "false").lower() == "true"
-        return self
-
-
-@lru_cache
+        """
+        Validate CORS origins.
+
+        Bare hosts get an https:// scheme and trailing slashes are dropped,
+        since browsers send Origin without one.
+        """
+        if v == ["*"]:
+            return v
+
+        return [
+            origin
+            if origin == "*"
+            else (origin if _has_http_scheme(origin) else f"https://{origin}").rstrip("/")
+            for origin in v
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_all_settings() -> tuple[
+    AppSettings,
+    DatabaseSettings,
+    RedisSettings,
+    TracingSettings,
+    MetricsSettings,
+    LoggingSettings,
+]:
+    """
+    Load every settings group once.
+
+    The .env file is read a single time into the process environment
+    (without overriding variables that are already set); each settings
+    class then only validates values from the environment.
+
+    Returns:
+        Tuple of (app, database, redis, tracing, metrics, logging) settings
+    """
+    load_dotenv(ENV_FILE, override=False)
+
+    return (
+        AppSettings(),
+        DatabaseSettings(),
+        RedisSettings(),
+        TracingSettings(),
+        MetricsSettings(),
+        LoggingSettings(),
+    )
+
+
 def get_settings() -> AppSettings:
     """
     Get cached application settings.
@@ -172,13 +255,15 @@ def get_settings() -> AppSettings:
     Returns:
         AppSettings: Cached settings instance
     """
-    return AppSettings()
+    return get_all_settings()[0]
 
 
 # Get database, redis, tracing, and metrics settings as global instances
-settings = get_settings()
-db_settings = DatabaseSettings()
-redis_settings = RedisSettings()
-tracing_settings = TracingSettings()
-metrics_settings = MetricsSettings()
-logging_settings = LoggingSettings()
+(
+    settings,
+    db_settings,
+    redis_settings,
+    tracing_settings,
+    metrics_settings,
+    logging_settings,
+) = get_all_settings()
@@ -11,9 +11,17 @@ This module handles:
 - Graceful shutdown of resources
 """
 
+import asyncio
+import socket
+
 import redis.asyncio as redis
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import db_settings, redis_settings
 from app.core.logging import get_logger
@@ -22,33 +30,99 @@ from app.core.metrics import (
     db_connections_idle,
 )
 from app.infrastructure.database import Base  # noqa: F401  (re-exported for back-compat)
+from app.infrastructure.redis import close_redis, get_redis
 
 logger = get_logger(__name__)
 
-# Create database engine
-engine = create_async_engine(
-    db_settings.database_url,
-    pool_size=db_settings.pool_size,
-    max_overflow=db_settings.max_overflow,
-    echo=False,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-)
+# Database engine and session factory, created on first use so that
+# importing the app (CLI tools, tests that override get_db) does not import
+# the asyncpg driver or build a pool; only engine creation is deferred.
+# ``engine`` and ``async_session_maker`` remain available as module
+# attributes via __getattr__ below.
+_engine: AsyncEngine | None = None
+_async_session_maker: async_sessionmaker[AsyncSession] | None = None
 
-# Create async session factory
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
 
+def get_engine() -> AsyncEngine:
+    """
+    Get or create the global database engine.
+
+    Returns:
+        Async SQLAlchemy engine
+    """
+    global _engine
+
+    if _engine is None:
+        _engine = create_async_engine(
+            db_settings.database_url,
+            pool_size=db_settings.pool_size,
+            max_overflow=db_settings.max_overflow,
+            # Engine-wide LRU of compiled statements, shared by every session.
+            # Don't replace it with an execution_options compiled_cache dict:
+            # that cache is unbounded and bypasses this size limit.
+            query_cache_size=db_settings.query_cache_size,
+            connect_args={
+                # SQLAlchemy's adapter-level cache and asyncpg's own statement cache
+                "prepared_statement_cache_size": db_settings.statement_cache_size,
+                "statement_cache_size": db_settings.statement_cache_size,
+                # Queries here are simple lookups; JIT planning costs more than it saves
+                "server_settings": {"jit": "on" if db_settings.jit else "off"},
+                # A stuck query fails its request instead of holding a pooled
+                # connection indefinitely
+                "command_timeout": db_settings.command_timeout,
+            },
+            echo=False,
+            # No per-checkout ping: stale connections are handled by pool_recycle and
+            # the background keepalive task instead of a SELECT 1 on every request.
+            pool_pre_ping=False,
+            pool_recycle=db_settings.pool_recycle,
+        )
+
+    return _engine
 
 
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """
+    Get or create the global session factory.
+
+    Returns:
+        Async session factory bound to the global engine
+    """
+    global _async_session_maker
+
+    if _async_session_maker is None:
+        _async_session_maker = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+
+    return _async_session_maker
+
+
+def __getattr__(name: str) -> object:
+    """Create ``engine`` / ``async_session_maker`` lazily on attribute access (PEP 562)."""
+    if name == "engine":
+        return get_engine()
+    if name == "async_session_maker":
+        return get_session_maker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 redis_pool: redis.ConnectionPool | None = None
 
+# TCP keepalive probing for Redis connections: first probe after 30s idle,
+# then every 10s, dropping the connection after 3 misses. The option names
+# are Linux-specific, so fall back to the OS defaults elsewhere.
+_REDIS_KEEPALIVE_OPTIONS: dict[int, int] = (
+    {socket.TCP_KEEPIDLE: 30, socket.TCP_KEEPINTVL: 10, socket.TCP_KEEPCNT: 3}
+    if hasattr(socket, "TCP_KEEPIDLE")
+    else {}
+)
+keepalive_task: asyncio.Task | None = None
+
 
 async def get_redis_pool() -> redis.ConnectionPool:
     """
@@ -64,13 +138,79 @@ async def get_redis_pool() -> redis.ConnectionPool:
         redis_pool = redis.ConnectionPool.from_url(
             redis_settings.redis_url,
             max_connections=redis_settings.pool_size,
-            decode_responses=True,
+            # Cached values are serialized JSON bodies that are sent to the
+            # client as-is, so keep them as bytes instead of decoding to str
+            decode_responses=False,
+            # Detect dead peers (e.g. a failed-over Redis) on idle connections
+            socket_keepalive=True,
+            socket_keepalive_options=_REDIS_KEEPALIVE_OPTIONS,
+            health_check_interval=redis_settings.health_check_interval,
+            retry_on_timeout=True,
         )
         logger.info("Redis connection pool initialized")
 
     return redis_pool
 
 
+async def _check_database() -> None:
+    """Verify the database is reachable."""
+    logger.info("Testing database connection")
+    async with get_engine().begin() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _keepalive_database(interval: int) -> None:
+    """
+    Periodically ping the database through the pool.
+
+    A failed ping is a disconnect, which makes SQLAlchemy invalidate the
+    pool, so connections dropped by the server (restart, failover) are
+    replaced in the background rather than failing the next request.
+
+    Args:
+        interval: Seconds between pings
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with get_engine().connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except Exception as e:
+            logger.warning("Database keepalive ping failed", error=str(e))
+
+
+async def _check_redis() -> None:
+    """Initialize the Redis pool and the shared cache client, then ping."""
+    await get_redis_pool()
+    client = await get_redis()
+    await client.ping()
+
+
+async def _close_redis_pool() -> None:
+    """Close the Redis cache client and connection pool."""
+    global redis_pool
+
+    await close_redis()
+
+    if redis_pool:
+        await redis_pool.disconnect()
+        redis_pool = None
+        logger.info("Redis connection pool closed")
+
+
+async def _dispose_engine() -> None:
+    """Stop the keepalive task and dispose the database engine."""
+    global keepalive_task
+
+    if keepalive_task:
+        keepalive_task.cancel()
+        keepalive_task = None
+
+    if _engine is not None:
+        await _engine.dispose()
+        logger.info("Database engine disposed")
+
+
 async def startup_event() -> None:
     """
     Application startup event handler.
@@ -78,18 +218,24 @@ async def startup_event() -> None:
     Initializes:
     - Database engine
     - Redis connection pool
+    - Database keepalive task
     - Metrics collection
     """
-    logger.info("Starting application startup sequence")
+    global keepalive_task
+
+    logger.info(
+        "Starting application startup sequence",
+        event_loop=type(asyncio.get_running_loop()).__module__,
+    )
 
     try:
-        # Test database connection
-        logger.info("Testing database connection")
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
+        # Database and Redis checks are independent, run them concurrently
+        await asyncio.gather(_check_database(), _check_redis())
 
-        # Get Redis pool
-        await get_redis_pool()
+        if db_settings.keepalive_interval and keepalive_task is None:
+            keepalive_task = asyncio.create_task(
+                _keepalive_database(db_settings.keepalive_interval)
+            )
 
         # Update metrics
         db_connections_active.set(0)
@@ -112,16 +258,7 @@ async def shutdown_event() -> None:
     logger.info("Starting application shutdown sequence")
 
     try:
-        # Close Redis pool
-        global redis_pool
-        if redis_pool:
-            await redis_pool.close()
-            redis_pool = None
-            logger.info("Redis connection pool closed")
-
-        # Dispose database engine
-        await engine.dispose()
-        logger.info("Database engine disposed")
+        await asyncio.gather(_close_redis_pool(), _dispose_engine())
 
         logger.info("Application shutdown completed successfully")
     except Exception as e:
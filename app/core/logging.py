@@ -6,13 +6,34 @@ Configures structlog for JSON-structured logging with tracing support.
 All logs must be JSON format with proper tracing context.
 """
 
+import atexit
 import logging.config
 import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
 import structlog
-from structlog.types import EventDict, Processor
+from structlog.types import EventDict, FilteringBoundLogger, Processor
 
 from app.core.config import logging_settings
 
+# Background listener that formats and writes queued log records
+_queue_listener: QueueListener | None = None
+
+
+class _PassThroughQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted.
+
+    The stock prepare() formats the record on the calling thread, which is
+    exactly the work we want off the event loop. structlog has already
+    bound the event dict to the record, so it is safe to hand over as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 
 def add_trace_id(logger: logging.Logger, _method_name: str, event_dict: EventDict) -> EventDict:
     """
@@ -63,37 +84,50 @@ def setup_logging() -> None:
     - Trace ID injection
     - Request ID injection
     - Proper log levels
+    - Background JSON rendering via a queue listener
     """
-    # Define log processors
-    processors: list[Processor] = [
+    global _queue_listener
+
+    # Enrichment shared by structlog loggers and foreign (stdlib) records
+    shared_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
         add_trace_id,
         add_request_id,
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.JSONRenderer(),
     ]
 
+    # JSON rendering and stdout writes happen on the listener thread; the
+    # logger hierarchy only sees the queue handler.
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=[
+                *shared_processors,
+                structlog.processors.format_exc_info,
+            ],
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.JSONRenderer(),
+            ],
+        )
+    )
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stop_logging()
+    _queue_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _queue_listener.start()
+
     # Configure logging
     logging.config.dictConfig(
         {
             "version": 1,
             "disable_existing_loggers": False,
-            "formatters": {
-                "json": {
-                    "()": structlog.stdlib.ProcessorFormatter,
-                    "processors": processors,
-                    "format": "%(message)s",
-                },
-            },
             "handlers": {
                 "console": {
-                    "class": "logging.StreamHandler",
-                    "formatter": "json",
-                    "stream": "ext://sys.stdout",
+                    "()": _PassThroughQueueHandler,
+                    "queue": log_queue,
                 },
             },
             "root": {
@@ -120,26 +154,44 @@ def setup_logging() -> None:
         }
     )
 
-    # Set up structlog
+    # Set up structlog. filter_by_level runs first so events below the
+    # configured level are dropped before any other processor does work.
     structlog.configure(
-    processors=[
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
+        processors=[
+            structlog.stdlib.filter_by_level,
+            *shared_processors,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        # Methods below the configured level are no-ops: calls return before
+        # the event dict is built or any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(logging_settings.log_level.upper())
+        ),
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
     )
 
 
+def stop_logging() -> None:
+    """
+    Flush queued log records and stop the background listener.
+
+    Safe to call more than once; also registered with atexit.
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_logging)
+
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str) -> FilteringBoundLogger:
     """
     Get a logger instance with proper configuration.
 
@@ -147,6 +199,9 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
         name: Logger name (typically __name__)
 
     Returns:
-        Configured BoundLogger instance
+        Configured level-filtering bound logger
     """
-    return structlog.get_logger(name)
+    # structlog.get_logger() is typed as Any; the configured wrapper class
+    # is make_filtering_bound_logger()
+    logger: FilteringBoundLogger = structlog.get_logger(name)
+    return logger
@@ -8,14 +8,17 @@ Provides metrics for:
 - Database operations
 - Cache operations
 - Custom business metrics
-"""
 
-from datetime import datetime
+High-frequency counters are ShardedCounters (see app.core.sharded_counter):
+same names and labels on /metrics, but no lock on the increment path.
+"""
 
 from prometheus_client import REGISTRY, Counter, Gauge, Histogram
 
+from app.core.sharded_counter import ShardedCounter, ShardedCounterChild
+
 # HTTP Metrics
-http_requests_total = Counter(
+http_requests_total = ShardedCounter(
     "http_requests_total",
     "Total HTTP requests",
     ["method", "endpoint", "status_code"],
@@ -30,10 +33,12 @@ http_request_duration_seconds = Histogram(
     registry=REGISTRY,
 )
 
+# Labelled by method only: the route is not known until the request has been
+# dispatched
 http_requests_in_progress = Gauge(
     "http_requests_in_progress",
     "Number of HTTP requests in progress",
-    ["method", "endpoint"],
+    ["method"],
     registry=REGISTRY,
 )
 
@@ -58,7 +63,7 @@ db_query_duration_seconds = Histogram(
     registry=REGISTRY,
 )
 
-db_queries_total = Counter(
+db_queries_total = ShardedCounter(
     "db_queries_total",
     "Total database queries",
     ["operation", "table"],
@@ -66,24 +71,26 @@ db_queries_total = Counter(
 )
 
 # Cache Metrics
-cache_hits_total = Counter(
-    "cache_hits_total",
-    "Total cache hits",
-    registry=REGISTRY,
-)
-
-cache_misses_total = Counter(
-    "cache_misses_total",
-    "Total cache misses",
+cache_result_total = ShardedCounter(
+    "cache_result_total",
+    "Total cache lookups by result (hit or miss)",
+    ["result"],
     registry=REGISTRY,
 )
+_cache_hit = cache_result_total.labels(result="hit")
+_cache_miss = cache_result_total.labels(result="miss")
 
 cache_operations_in_progress = Gauge(
     "cache_operations_in_progress",
     "Number of cache operations in progress",
+    ["operation"],
     registry=REGISTRY,
 )
 
+# Pre-bound children for the fixed cache operations (hot path)
+cache_get_in_progress = cache_operations_in_progress.labels(operation="get")
+cache_set_in_progress = cache_operations_in_progress.labels(operation="set")
+
 cache_set_duration_seconds = Histogram(
     "cache_set_duration_seconds",
     "Cache set operation duration in seconds",
@@ -107,82 +114,116 @@ business_operations_duration_seconds = Histogram(
 )
 
 # Todo-specific metrics
-todos_created_total = Counter(
+todos_created_total = ShardedCounter(
     "todos_created_total",
     "Total number of todos created",
     registry=REGISTRY,
 )
 
-todos_updated_total = Counter(
+todos_updated_total = ShardedCounter(
     "todos_updated_total",
     "Total number of todos updated",
     registry=REGISTRY,
 )
 
-todos_deleted_total = Counter(
+todos_deleted_total = ShardedCounter(
     "todos_deleted_total",
     "Total number of todos deleted",
     registry=REGISTRY,
 )
 
-todos_completed_total = Counter(
+todos_completed_total = ShardedCounter(
     "todos_completed_total",
     "Total number of todos completed",
     registry=REGISTRY,
 )
 
 
-def record_http_request(method: str, endpoint: str, status_code: int, duration: float) -> None:
+# Bound label children per (method, endpoint, status_code). Endpoints are route
+# templates, so the set of keys is small and fixed; caching the children skips
+# the registry's label validation and lock on every request.
+_http_request_children: dict[tuple[str, str, int], tuple[ShardedCounterChild, Histogram]] = {}
+
+
+def _get_http_request_children(
+    method: str, endpoint: str, status_code: int
+) -> tuple[ShardedCounterChild, Histogram]:
     """
-    Record an HTTP request metric.
+    Get the bound HTTP request metrics for a label combination.
 
     Args:
         method: HTTP method (GET, POST, etc.)
         endpoint: Request endpoint
         status_code: HTTP status code
-        duration: Request duration in seconds
+
+    Returns:
+        Tuple of (request counter, duration histogram) children
     """
-    http_requests_total.labels(method=method, endpoint=endpoint, status_code=status_code).inc()
-    http_request_duration_seconds.labels(method=method, endpoint=endpoint).observe(duration)
+    key = (method, endpoint, status_code)
+    children = _http_request_children.get(key)
+
+    if children is None:
+        children = (
+            http_requests_total.labels(
+                method=method, endpoint=endpoint, status_code=status_code
+            ),
+            http_request_duration_seconds.labels(method=method, endpoint=endpoint),
+        )
+        _http_request_children[key] = children
 
+    return children
 
-def record_http_request_start(method: str, endpoint: str) -> datetime:
+
+def record_http_request(method: str, endpoint: str, status_code: int, duration: float) -> None:
     """
-    Record start of HTTP request.
+    Record an HTTP request metric.
 
     Args:
-        method: HTTP method
+        method: HTTP method (GET, POST, etc.)
         endpoint: Request endpoint
-
-    Returns:
-        Start time for duration calculation.
+        status_code: HTTP status code
+        duration: Request duration in seconds
     """
-    http_requests_in_progress.labels(method=method, endpoint=endpoint).inc()
-    return datetime.now()
+    requests_total, request_duration = _get_http_request_children(method, endpoint, status_code)
+    requests_total.inc()
+    request_duration.observe(duration)
+
 
+# Bound in-progress gauge children per method, cached like _http_request_children
+_http_in_progress_children: dict[str, Gauge] = {}
 
-def record_http_request_end(method: str, endpoint: str, status_code: int, duration: float) -> None:
+
+def get_http_requests_in_progress(method: str) -> Gauge:
     """
-    Record end of HTTP request.
+    Get the bound in-progress gauge for an HTTP method.
 
     Args:
-        method: HTTP method
-        endpoint: Request endpoint
-        status_code: HTTP status code
-        duration: Request duration in seconds
+        method: HTTP method (GET, POST, etc.)
+
+    Returns:
+        Gauge child to inc() when a request starts and dec() when it ends
     """
-    http_requests_in_progress.labels(method=method, endpoint=endpoint).dec()
-    record_http_request(method, endpoint, status_code, duration)
+    gauge = _http_in_progress_children.get(method)
+
+    if gauge is None:
+        gauge = http_requests_in_progress.labels(method=method)
+        _http_in_progress_children[method] = gauge
+
+    return gauge
 
 
 def record_cache_hit() -> None:
     """Record a cache hit."""
-    cache_hits_total.inc()
+    _cache_hit.inc()
 
 
 def record_cache_miss() -> None:
     """Record a cache miss."""
-    cache_misses_total.inc()
+    _cache_miss.inc()
+
+
+# Bound label children per (operation, table); see _http_request_children
+_db_query_children: dict[tuple[str, str], tuple[ShardedCounterChild, Histogram]] = {}
 
 
 def record_db_query(operation: str, table: str, duration: float) -> None:
@@ -194,8 +235,19 @@ def record_db_query(operation: str, table: str, duration: float) -> None:
         table: Table name
         duration: Query duration in seconds
     """
-    db_queries_total.labels(operation=operation, table=table).inc()
-    db_query_duration_seconds.labels(operation=operation, table=table).observe(duration)
+    key = (operation, table)
+    children = _db_query_children.get(key)
+
+    if children is None:
+        children = (
+            db_queries_total.labels(operation=operation, table=table),
+            db_query_duration_seconds.labels(operation=operation, table=table),
+        )
+        _db_query_children[key] = children
+
+    queries_total, query_duration = children
+    queries_total.inc()
+    query_duration.observe(duration)
 
 
 def record_business_operation(operation: str, status: str, duration: float) -> None:
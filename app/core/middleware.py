@@ -0,0 +1,85 @@
+"""
+HTTP Middleware
+===============
+
+Request-level middleware shared by every route.
+
+Provides:
+- Prometheus HTTP metrics (request count, latency and requests in progress)
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import get_http_requests_in_progress, record_http_request
+
+# Label used for requests that did not match any route (404s, scanners).
+# Using the raw URL path here would make label cardinality unbounded.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def get_route_path(scope: Scope) -> str:
+    """
+    Get the route template for a handled request.
+
+    FastAPI's router stores the matched APIRoute in the ASGI scope, so after
+    the request has been dispatched this returns e.g.
+    ``/api/v1/todos/{todo_id}`` rather than the concrete URL. Plain Starlette
+    routes do not set it: /docs, /redoc and /openapi.json are reported as
+    UNMATCHED_ROUTE along with real 404s.
+
+    Args:
+        scope: ASGI connection scope
+
+    Returns:
+        Route path template, or UNMATCHED_ROUTE
+    """
+    route = scope.get("route")
+    return route.path if route is not None else UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Record HTTP request metrics for every request.
+
+    A plain ASGI middleware rather than a BaseHTTPMiddleware: the status code
+    is taken from the http.response.start message, so the response body is
+    passed through without an extra task and stream per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Time the request and record its metrics.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        in_progress = get_http_requests_in_progress(scope["method"])
+        in_progress.inc()
+        start = time.perf_counter()
+        # Reported if the app raises before sending a response
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            record_http_request(
+                scope["method"], get_route_path(scope), status_code, time.perf_counter() - start
+            )
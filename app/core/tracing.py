@@ -10,31 +10,37 @@ Coverage:
 - Database queries (SQLAlchemy)
 - Cache operations (Redis)
 """
-from contextlib import contextmanager
+import os
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
 from typing import Any
 
 from opentelemetry import trace
-#from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-#from opentelemetry.instrumentation.redis import RedisInstrumentor
-#from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
-#from opentelemetry.sdk.resources import SERVICE_NAME, SERVICE_VERSION, Resource
-#from opentelemetry.sdk.trace import TracerProvider
-#from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-#from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 from app.core.config import tracing_settings
 
+# Stateless, so one instance serves every request
+_PROPAGATOR = TraceContextTextMapPropagator()
+
+# Header names (lowercase) that carry trace context
+_TRACE_HEADERS = frozenset(("traceparent", "trace-id", "tracestate"))
+
 
 def setup_tracing(app: Any) -> None:
     """
     Setup OpenTelemetry tracing for the application.
 
     This function:
-    1. Configures the tracer provider with resource attributes
+    1. Configures the tracer provider with resource attributes and a
+       head-based sampler
     2. Sets up span processors (batch for production, console for dev)
     3. Instruments FastAPI application
-    4. Instruments SQLAlchemy database
-    5. Instruments Redis cache
+    4. Instruments SQLAlchemy database (unless otel_instrument_sqlalchemy is off)
+    5. Instruments Redis cache (unless otel_instrument_redis is off)
+
+    The SDK and instrumentation packages are optional dependencies, so they
+    are imported here rather than at module level.
 
     Args:
         app: FastAPI application instance
@@ -42,6 +48,16 @@ def setup_tracing(app: Any) -> None:
     if not tracing_settings.otel_enabled:
         return
 
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    from opentelemetry.sdk.resources import SERVICE_NAME, SERVICE_VERSION, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+    )
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
     # Create resource with service attributes
     resource = Resource.create(
         {
@@ -52,8 +68,16 @@ def setup_tracing(app: Any) -> None:
         }
     )
 
+    # Head-based sampling: the keep/drop decision is made when the root span
+    # starts, so unsampled requests get non-recording spans and skip attribute
+    # writes and export. OTEL_TRACES_SAMPLER / OTEL_TRACES_SAMPLER_ARG, when
+    # set, are honoured by the SDK instead.
+    sampler = None
+    if "OTEL_TRACES_SAMPLER" not in os.environ:
+        sampler = ParentBased(TraceIdRatioBased(tracing_settings.otel_sampling_rate))
+
     # Set up tracer provider
-    provider = TracerProvider(resource=resource)
+    provider = TracerProvider(resource=resource, sampler=sampler)
     trace.set_tracer_provider(provider)
 
     # Add span processors
@@ -63,19 +87,37 @@ def setup_tracing(app: Any) -> None:
         from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
         otlp_exporter = OTLPSpanExporter(endpoint=tracing_settings.otel_endpoint)
-        provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
+        # Larger queue absorbs bursts; smaller batches and a shorter delay keep
+        # export latency low; a short timeout fails fast instead of stalling
+        provider.add_span_processor(
+            BatchSpanProcessor(
+                otlp_exporter,
+                max_queue_size=tracing_settings.otel_bsp_max_queue_size,
+                schedule_delay_millis=tracing_settings.otel_bsp_schedule_delay,
+                max_export_batch_size=tracing_settings.otel_bsp_max_export_batch_size,
+                export_timeout_millis=tracing_settings.otel_bsp_export_timeout,
+            )
+        )
     else:
         # Development: console exporter for debugging
-        provider.add_span_processor(ConsoleSpanExporter())
+        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
 
     # Instrument FastAPI
     FastAPIInstrumentor.instrument_app(app)
 
     # Instrument SQLAlchemy
-    SQLAlchemyInstrumentor().instrument(enable_commenter=False, sqlalchemy_plugin=True)
+    if tracing_settings.otel_instrument_sqlalchemy:
+        from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+
+        # Without an engine argument this patches create_engine /
+        # create_async_engine, so it must run before get_engine()
+        SQLAlchemyInstrumentor().instrument(enable_commenter=False)
 
     # Instrument Redis
-    RedisInstrumentor().instrument()
+    if tracing_settings.otel_instrument_redis:
+        from opentelemetry.instrumentation.redis import RedisInstrumentor
+
+        RedisInstrumentor().instrument()
 
 
 def get_tracer() -> trace.Tracer:
@@ -91,20 +133,49 @@ def get_tracer() -> trace.Tracer:
     return trace.get_tracer(__name__)
 
 
-@contextmanager
-def trace_operation(name: str, **kwargs: Any):
+class _NoopTrace:
+    """Reusable context manager for trace_operation when tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NOOP_TRACE = _NoopTrace()
+
+
+def trace_operation(name: str, **kwargs: Any) -> AbstractContextManager[Any]:
     """
     Context manager for tracing operations.
 
+    With tracing disabled this returns a shared no-op context manager, so
+    no generator or span is created per call.
+
     Args:
         name: Operation name
         **kwargs: Additional span attributes
 
-    Yields:
-        Tracer context
+    Returns:
+        Context manager yielding the span (None when tracing is disabled)
     """
     if not tracing_settings.otel_enabled:
-        yield
+        return _NOOP_TRACE
+
+    return _trace_operation(name, **kwargs)
+
+
+@contextmanager
+def _trace_operation(name: str, **kwargs: Any) -> Iterator[trace.Span]:
+    """Start an INTERNAL span for trace_operation."""
+    # Inside an unsampled trace the child would be non-recording anyway;
+    # skip creating it and building its attributes
+    parent = trace.get_current_span()
+    if parent.get_span_context().is_valid and not parent.is_recording():
+        yield parent
         return
 
     tracer = get_tracer()
@@ -125,7 +196,7 @@ def extract_trace_context(_request: Any) -> dict[str, str]:
         Dictionary with extracted trace context
     """
     carrier = {}
-    TraceContextTextMapPropagator().inject(carrier)
+    _PROPAGATOR.inject(carrier)
     return carrier
 
 
@@ -136,7 +207,7 @@ def inject_trace_context(carrier: dict[str, str]) -> None:
     Args:
         carrier: Dictionary to inject context into
     """
-    TraceContextTextMapPropagator().inject(carrier)
+    _PROPAGATOR.inject(carrier)
 
 
 def extract_from_headers(headers: dict[str, str]) -> dict[str, str]:
@@ -149,11 +220,7 @@ def extract_from_headers(headers: dict[str, str]) -> dict[str, str]:
     Returns:
         Dictionary with trace context
     """
-    carrier = {}
-    for key, value in headers.items():
-        if key.lower() in ("traceparent", "trace-id", "tracestate"):
-            carrier[key] = value
-    return carrier
+    return {key: value for key, value in headers.items() if key.lower() in _TRACE_HEADERS}
 
 
 def add_span_attribute(span: trace.Span, key: str, value: Any) -> None:
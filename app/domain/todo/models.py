@@ -14,11 +14,36 @@ This layer contains:
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Dialect, Index, SmallInteger, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
+from app.domain.todo.schemas import PRIORITY_ORDER
 from app.infrastructure.database import Base
 
+_PRIORITY_NAMES = {rank: name for name, rank in PRIORITY_ORDER.items()}
+
+
+class PriorityType(TypeDecorator[str]):
+    """
+    Priority stored as its SMALLINT rank (low=1, medium=2, high=3).
+
+    The API and the ORM attribute keep using the names; the database sees
+    2-byte integers, so ORDER BY priority sorts by rank and the index on
+    the column stays small.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> int | None:
+        """Convert a priority name to its rank."""
+        return PRIORITY_ORDER[value] if value is not None else None
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> str | None:
+        """Convert a stored rank back to its priority name."""
+        return _PRIORITY_NAMES[value] if value is not None else None
+
 
 class Todo(Base):
     """
@@ -28,6 +53,20 @@ class Todo(Base):
     """
 
     __tablename__ = "todos"
+    __table_args__ = (
+        # Sort column plus the id tiebreaker, so paging (OFFSET or keyset)
+        # walks the index without visiting the table
+        Index("ix_todos_created_at", "created_at", "id"),
+        Index("ix_todos_priority", "priority", "id"),
+        # List pages filter on is_completed / priority and sort by created_at
+        Index("ix_todos_completed_priority_created", "is_completed", "priority", "created_at"),
+        Index("ix_todos_priority_created", "priority", "created_at", "id"),
+        # Active todos newest first, without the completed rows in the index
+        Index("ix_todos_pending", "created_at", "id", postgresql_where=text("is_completed = false")),
+    )
+    # Fetch server-generated columns (id, created_at, updated_at) with
+    # RETURNING on INSERT/UPDATE instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -36,7 +75,7 @@ class Todo(Base):
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(String(1000), nullable=True)
     is_completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    priority: Mapped[str] = mapped_column(String(20), default="medium", nullable=False)
+    priority: Mapped[str] = mapped_column(PriorityType, default="medium", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -52,23 +91,6 @@ class Todo(Base):
     # Relationships
     # User relationship can be added if needed
 
-    def to_dict(self) -> dict[str, Any]:
-        """
-        Convert entity to dictionary representation.
-
-        Returns:
-            Dictionary representation of the entity
-        """
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "is_completed": self.is_completed,
-            "priority": self.priority,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
-
     def update(self, **kwargs: Any) -> None:
         """
         Update entity attributes.
@@ -11,8 +11,12 @@ These schemas are:
 """
 
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
+
+# Validated by pydantic-core as a set membership check, no regex
+Priority = Literal["low", "medium", "high"]
 
 
 class TodoBase(BaseModel):
@@ -21,9 +25,8 @@ class TodoBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=255, description="Todo title")
     description: str | None = Field(None, max_length=1000, description="Todo description")
     is_completed: bool = Field(default=False, description="Todo completion status")
-    priority: str = Field(
+    priority: Priority = Field(
         default="medium",
-        pattern="^(low|medium|high)$",
         description="Todo priority: low, medium, or high",
     )
 
@@ -47,7 +50,7 @@ class TodoUpdate(BaseModel):
     title: str | None = Field(None, min_length=1, max_length=255)
     description: str | None = Field(None, max_length=1000)
     is_completed: bool | None = None
-    priority: str | None = Field(None, pattern="^(low|medium|high)$")
+    priority: Priority | None = None
 
     model_config = ConfigDict(
         extra="forbid",
@@ -61,10 +64,8 @@ class TodoResponse(TodoBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={datetime: lambda v: v.isoformat()},
-    )
+    # datetimes are serialized to ISO 8601 by pydantic-core itself
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TodoListResponse(BaseModel):
@@ -72,10 +73,16 @@ class TodoListResponse(BaseModel):
 
     items: list[TodoResponse]
     total: int
+    total_is_estimate: bool = Field(
+        False, description="total is capped or estimated; request exact_count=true for exact"
+    )
     page: int
     page_size: int
     has_next: bool
     has_previous: bool
+    next_cursor: str | None = Field(
+        None, description="Pass as ?cursor= to fetch the next page by keyset"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -87,20 +94,11 @@ class HealthResponse(BaseModel):
     version: str
     timestamp: datetime
 
-    model_config = ConfigDict(
-        json_encoders={datetime: lambda v: v.isoformat()},
-    )
-
 
-# Validators for prioritization
-@field_validator("priority")
-@classmethod
-def validate_priority(_cls, v: str) -> str:
-    """Validate priority is one of allowed values."""
-    valid_priorities = ["low", "medium", "high"]
-    if v not in valid_priorities:
-        raise ValueError(f"Priority must be one of {valid_priorities}")
-    return v
+# Version of the serialized todo bodies kept in the read cache. Bump it
+# whenever TodoResponse or TodoListResponse change shape, so bodies cached
+# by the previous release are never served by the new one.
+RESPONSE_CACHE_VERSION = 1
 
 
 # Priority ordering for sorting
@@ -15,9 +15,19 @@ from collections.abc import AsyncGenerator
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.lifespan import async_session_maker, engine
+from app.core.lifespan import get_engine, get_session_maker
+from app.core.logging import get_logger
+from app.infrastructure import redis as cache
 from app.infrastructure.database import Base
 
+logger = get_logger(__name__)
+
+# Resolved once; every ORM model is registered on this metadata at import time
+_METADATA = Base.metadata
+
+# session.info key of the cache invalidations waiting for COMMIT
+_PENDING_INVALIDATIONS = "pending_cache_invalidations"
+
 
 async def init_db() -> None:
     """
@@ -26,9 +36,9 @@ async def init_db() -> None:
     Creates all tables defined in the Base metadata.
     Use this in application startup.
     """
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    print("Database tables created successfully")
+    async with get_engine().begin() as conn:
+        await conn.run_sync(_METADATA.create_all)
+    logger.info("Database tables created successfully")
 
 
 async def drop_db() -> None:
@@ -38,9 +48,9 @@ async def drop_db() -> None:
     WARNING: This deletes all data! Use with caution.
     Use this for testing only.
     """
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    print("Database tables dropped successfully")
+    async with get_engine().begin() as conn:
+        await conn.run_sync(_METADATA.drop_all)
+    logger.info("Database tables dropped successfully")
 
 
 async def test_connection() -> bool:
@@ -51,26 +61,67 @@ async def test_connection() -> bool:
         True if connection is successful
     """
     try:
-        async with engine.connect() as conn:
+        async with get_engine().connect() as conn:
             await conn.execute(text("SELECT 1"))
         return True
     except Exception as e:
-        print(f"Database connection failed: {e}")
+        logger.error("Database connection failed", error=str(e))
         return False
 
 
+def invalidate_after_commit(session: AsyncSession, namespace: str, *keys: str) -> None:
+    """
+    Schedule a cache invalidation for when the session's transaction commits.
+
+    Invalidating at flush time would let a concurrent read, which still sees
+    the old committed row, refill the cache before the write is visible.
+
+    Args:
+        session: Session of the unit of work
+        namespace: Cache namespace whose generation to bump
+        *keys: Additional keys (without prefix) to delete
+    """
+    pending: dict[str, set[str]] = session.info.setdefault(_PENDING_INVALIDATIONS, {})
+    pending.setdefault(namespace, set()).update(keys)
+
+
+async def flush_cache_invalidations(session: AsyncSession) -> None:
+    """
+    Run the invalidations scheduled with invalidate_after_commit.
+
+    Call only once the transaction has committed.
+
+    Args:
+        session: Session of the committed unit of work
+    """
+    pending: dict[str, set[str]] = session.info.pop(_PENDING_INVALIDATIONS, {})
+    for namespace, keys in pending.items():
+        await cache.invalidate_namespace(namespace, *keys)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides a database session.
-    Commits on success, rolls back on any exception.
+
+    The whole request runs in one transaction (unit of work): repositories
+    only flush, and the single COMMIT happens here on success; any
+    exception rolls it back. Cache invalidations scheduled during the
+    request run after the COMMIT.
 
     Yields:
         AsyncSession: Database session
     """
-    async with async_session_maker() as session:
-        try:
+    async with get_session_maker()() as session:
+        async with session.begin():
             yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+
+        await flush_cache_invalidations(session)
+
+
+def __getattr__(name: str) -> object:
+    """Forward lazily created ``engine`` / ``async_session_maker`` from app.core.lifespan."""
+    if name in ("engine", "async_session_maker"):
+        from app.core import lifespan
+
+        return getattr(lifespan, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
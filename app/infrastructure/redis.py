@@ -10,32 +10,55 @@ Provides:
 - Redis client helper functions
 """
 
-import json
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
 
 from app.core.logging import get_logger
 from app.core.metrics import (
-    cache_hits_total,
-    cache_misses_total,
-    cache_operations_in_progress,
+    cache_get_in_progress,
+    cache_set_in_progress,
+    record_cache_hit,
+    record_cache_miss,
 )
 
+logger = get_logger(__name__)
 
-def record_cache_hit() -> None:
-    cache_hits_total.inc()
+# Global Redis client instance. Cache helpers copy it into a local once per
+# call, so a close_redis() during an await cannot swap it out mid-operation.
+redis_client: Redis | None = None
 
+# Namespaced caches (e.g. list pages) keep a generation counter at
+# <prefix>:<namespace>:generation; entries live at
+# <prefix>:<namespace>:<generation>:<key>. Invalidating the whole namespace
+# is a single INCR, and entries of old generations simply expire.
+#
+# Reads the current generation and the entry under it in one round-trip,
+# returning {generation, value}.
+NAMESPACED_GET_SCRIPT = """
+local generation = redis.call("GET", KEYS[1]) or "0"
+return {generation, redis.call("GET", ARGV[1] .. ":" .. generation .. ":" .. ARGV[2])}
+"""
 
-def record_cache_miss() -> None:
-    cache_misses_total.inc()
+# Stores an entry only if the namespace is still at the generation the
+# caller read before loading it from the database, so a fill racing with
+# invalidate_namespace() cannot put a stale payload back. Returns 1 if stored.
+NAMESPACED_SET_SCRIPT = """
+if (redis.call("GET", KEYS[1]) or "0") ~= ARGV[1] then
+    return 0
+end
+redis.call("SETEX", KEYS[2], ARGV[2], ARGV[3])
+return 1
+"""
 
+namespaced_get_script: AsyncScript | None = None
+namespaced_set_script: AsyncScript | None = None
 
-logger = get_logger(__name__)
-
-# Global Redis client instance
-redis_client: Redis | None = None
+# SCAN COUNT hint and UNLINK pipeline flush size for clear_pattern
+CLEAR_BATCH_SIZE = 500
 
 
 async def get_redis() -> Redis:
@@ -45,11 +68,13 @@ async def get_redis() -> Redis:
     Returns:
         Redis client instance
     """
-    global redis_client
+    global redis_client, namespaced_get_script, namespaced_set_script
 
     if redis_client is None:
         pool = await get_redis_pool()
         redis_client = redis.Redis(connection_pool=pool)
+        namespaced_get_script = redis_client.register_script(NAMESPACED_GET_SCRIPT)
+        namespaced_set_script = redis_client.register_script(NAMESPACED_SET_SCRIPT)
         logger.info("Redis client initialized")
 
     return redis_client
@@ -69,10 +94,12 @@ async def get_redis_pool() -> redis.ConnectionPool:
 
 async def close_redis() -> None:
     """Close Redis client and connection pool."""
-    global redis_client
+    global redis_client, namespaced_get_script, namespaced_set_script
     if redis_client:
-        await redis_client.close()
+        await redis_client.aclose()
         redis_client = None
+        namespaced_get_script = None
+        namespaced_set_script = None
         logger.info("Redis client closed")
 
 
@@ -90,85 +117,122 @@ def get_key(key: str, prefix: str = "todo") -> str:
     return f"{prefix}:{key}"
 
 
-async def get(key: str, prefix: str = "todo") -> Any | None:
+async def get_raw(key: str, prefix: str = "todo") -> str | bytes | None:
     """
-    Get value from cache.
+    Get the stored payload from cache without decoding it.
+
+    Used for values that are already serialized (e.g. JSON response bodies)
+    so they can be sent to the client as-is.
 
     Args:
         key: Cache key
         prefix: Key prefix
 
     Returns:
-        Cached value or None
+        Cached payload or None
     """
-    global redis_client
+    client = redis_client
 
     # BUG #10 FIX: Guard against None redis_client before calling methods on it.
-    if redis_client is None:
+    if client is None:
         logger.warning("Redis client is not initialized, skipping cache get")
         return None
 
     cache_key = get_key(key, prefix)
 
-    cache_operations_in_progress.labels(operation="get").inc()
+    cache_get_in_progress.inc()
 
     try:
-        value = await redis_client.get(cache_key)
-        cache_operations_in_progress.labels(operation="get").dec()
+        value: bytes | None = await client.get(cache_key)
+        cache_get_in_progress.dec()
 
         if value:
             record_cache_hit()
-            logger.debug(f"Cache hit for key: {cache_key}")
-            return json.loads(value)
+            logger.debug("Cache hit", key=cache_key)
+            return value
 
         record_cache_miss()
-        logger.debug(f"Cache miss for key: {cache_key}")
+        logger.debug("Cache miss", key=cache_key)
         return None
 
     except Exception as e:
-        cache_operations_in_progress.labels(operation="get").dec()
-        logger.error(f"Cache get error for key {cache_key}: {e}")
+        cache_get_in_progress.dec()
+        logger.error("Cache get error", key=cache_key, error=str(e))
         return None
 
 
-async def set(key: str, value: Any, prefix: str = "todo", ttl: int = 3600) -> bool:
+async def get(key: str, prefix: str = "todo") -> Any | None:
     """
-    Set value in cache.
+    Get value from cache.
 
     Args:
         key: Cache key
-        value: Value to cache
+        prefix: Key prefix
+
+    Returns:
+        Cached value or None
+    """
+    value = await get_raw(key, prefix)
+    return orjson.loads(value) if value is not None else None
+
+
+async def set_raw(
+    key: str, value: str | bytes, prefix: str = "todo", ttl: int = 3600
+) -> bool:
+    """
+    Store an already-serialized payload in cache.
+
+    Args:
+        key: Cache key
+        value: Serialized value to cache
         prefix: Key prefix
         ttl: Time to live in seconds
 
     Returns:
         True if successful
     """
-    global redis_client
+    client = redis_client
 
     # BUG #10 FIX: Guard against None redis_client.
-    if redis_client is None:
+    if client is None:
         logger.warning("Redis client is not initialized, skipping cache set")
         return False
 
     cache_key = get_key(key, prefix)
 
-    cache_operations_in_progress.labels(operation="set").inc()
+    cache_set_in_progress.inc()
 
     try:
-        serialized_value = json.dumps(value)
-        await redis_client.setex(cache_key, ttl, serialized_value)
-        cache_operations_in_progress.labels(operation="set").dec()
+        await client.setex(cache_key, ttl, value)
+        cache_set_in_progress.dec()
 
-        logger.debug(f"Cache set for key: {cache_key}, TTL: {ttl}s")
+        logger.debug("Cache set", key=cache_key, ttl=ttl)
         return True
 
     except Exception as e:
-        cache_operations_in_progress.labels(operation="set").dec()
-        logger.error(f"Cache set error for key {cache_key}: {e}")
+        cache_set_in_progress.dec()
+        logger.error("Cache set error", key=cache_key, error=str(e))
         return False
 
 
+async def set(key: str, value: Any, prefix: str = "todo", ttl: int = 3600) -> bool:
+    """
+    Set value in cache.
+
+    Args:
+        key: Cache key
+        value: Value to cache
+        prefix: Key prefix
+        ttl: Time to live in seconds
+
+    Returns:
+        True if successful
+    """
+    # orjson emits bytes and handles datetime natively; default=str covers
+    # other non-JSON types such as Decimal
+    return await set_raw(key, orjson.dumps(value, default=str), prefix, ttl)
+
+
 async def delete(key: str, prefix: str = "todo") -> bool:
     """
     Delete value from cache.
@@ -180,22 +244,22 @@ async def delete(key: str, prefix: str = "todo") -> bool:
     Returns:
         True if successful
     """
-    global redis_client
+    client = redis_client
 
     # BUG #10 FIX: Guard against None redis_client.
-    if redis_client is None:
+    if client is None:
         logger.warning("Redis client is not initialized, skipping cache delete")
         return False
 
     cache_key = get_key(key, prefix)
 
     try:
-        await redis_client.delete(cache_key)
-        logger.debug(f"Cache delete for key: {cache_key}")
+        await client.delete(cache_key)
+        logger.debug("Cache delete", key=cache_key)
         return True
 
     except Exception as e:
-        logger.error(f"Cache delete error for key {cache_key}: {e}")
+        logger.error("Cache delete error", key=cache_key, error=str(e))
         return False
 
 
@@ -210,21 +274,21 @@ async def exists(key: str, prefix: str = "todo") -> bool:
     Returns:
         True if key exists
     """
-    global redis_client
+    client = redis_client
 
     # BUG #10 FIX: Guard against None redis_client.
-    if redis_client is None:
+    if client is None:
         logger.warning("Redis client is not initialized, skipping cache exists")
         return False
 
     cache_key = get_key(key, prefix)
 
     try:
-        result = await redis_client.exists(cache_key)
+        result: int = await client.exists(cache_key)
         return result > 0
 
     except Exception as e:
-        logger.error(f"Cache exists error for key {cache_key}: {e}")
+        logger.error("Cache exists error", key=cache_key, error=str(e))
         return False
 
 
@@ -238,21 +302,235 @@ async def clear_pattern(pattern: str) -> int:
     Returns:
         Number of keys deleted
     """
-    global redis_client
+    client = redis_client
 
     # BUG #10 FIX: Guard against None redis_client.
-    if redis_client is None:
+    if client is None:
         logger.warning("Redis client is not initialized, skipping clear_pattern")
         return 0
 
     try:
-        keys = await redis_client.keys(pattern)
-        if keys:
-            deleted = await redis_client.delete(*keys)
-            logger.info(f"Cleared {deleted} keys matching pattern: {pattern}")
-            return deleted
-        return 0
+        # SCAN walks the keyspace in steps instead of blocking the server like
+        # KEYS; UNLINK frees memory in the background. Batches of
+        # CLEAR_BATCH_SIZE share one round trip.
+        deleted: int = 0
+        async with client.pipeline(transaction=False) as pipe:
+            queued = 0
+            async for key in client.scan_iter(match=pattern, count=CLEAR_BATCH_SIZE):
+                pipe.unlink(key)
+                queued += 1
+                if queued == CLEAR_BATCH_SIZE:
+                    deleted += sum(await pipe.execute())
+                    queued = 0
+            if queued:
+                deleted += sum(await pipe.execute())
+
+        if deleted:
+            logger.info("Cleared cache keys", pattern=pattern, deleted=deleted)
+        return deleted
 
     except Exception as e:
-        logger.error(f"Error clearing pattern {pattern}: {e}")
+        logger.error("Error clearing cache pattern", pattern=pattern, error=str(e))
         return 0
+
+
+def namespaced_key(namespace: str, generation: str, key: str) -> str:
+    """
+    Build a key (without prefix) inside a namespace generation.
+
+    Args:
+        namespace: Cache namespace (e.g. "list:v1")
+        generation: Generation returned by get_raw_namespaced
+        key: Key within the namespace
+
+    Returns:
+        Cache key
+    """
+    return f"{namespace}:{generation}:{key}"
+
+
+async def get_raw_namespaced(
+    namespace: str, key: str, prefix: str = "todo"
+) -> tuple[str, bytes | None]:
+    """
+    Get a payload from the current generation of a namespace.
+
+    Args:
+        namespace: Cache namespace
+        key: Key within the namespace
+        prefix: Key prefix
+
+    Returns:
+        Tuple of (current generation, cached payload or None). Store a miss
+        with set_raw_namespaced(namespace, generation, namespaced_key(...))
+        so a concurrent invalidate_namespace() is not undone.
+    """
+    script = namespaced_get_script
+
+    if script is None:
+        logger.warning("Redis client is not initialized, skipping cache get")
+        return "0", None
+
+    cache_get_in_progress.inc()
+
+    try:
+        raw_generation, value = await script(
+            keys=[get_key(f"{namespace}:generation", prefix)],
+            args=[get_key(namespace, prefix), key],
+        )
+        cache_get_in_progress.dec()
+        generation: str = raw_generation.decode()
+
+        if value:
+            record_cache_hit()
+            logger.debug("Cache hit", namespace=namespace, generation=generation, key=key)
+            return generation, value
+
+        record_cache_miss()
+        logger.debug("Cache miss", namespace=namespace, generation=generation, key=key)
+        return generation, None
+
+    except Exception as e:
+        cache_get_in_progress.dec()
+        logger.error("Cache get error", namespace=namespace, key=key, error=str(e))
+        return "0", None
+
+
+async def get_raw_with_generation(
+    namespace: str, key: str, prefix: str = "todo"
+) -> tuple[str, bytes | None]:
+    """
+    Get a payload stored outside the namespace along with its generation.
+
+    For entries kept at a fixed key (e.g. single items) that are deleted by
+    invalidate_namespace(), but whose fills are guarded by the generation.
+
+    Args:
+        namespace: Cache namespace guarding the entry
+        key: Cache key
+        prefix: Key prefix
+
+    Returns:
+        Tuple of (current generation, cached payload or None)
+    """
+    client = redis_client
+
+    if client is None:
+        logger.warning("Redis client is not initialized, skipping cache get")
+        return "0", None
+
+    cache_key = get_key(key, prefix)
+
+    cache_get_in_progress.inc()
+
+    try:
+        # The generation is read first, so it is never newer than the payload
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(get_key(f"{namespace}:generation", prefix))
+            pipe.get(cache_key)
+            raw_generation, value = await pipe.execute()
+        cache_get_in_progress.dec()
+        generation: str = raw_generation.decode() if raw_generation else "0"
+
+        if value:
+            record_cache_hit()
+            logger.debug("Cache hit", key=cache_key, generation=generation)
+            return generation, value
+
+        record_cache_miss()
+        logger.debug("Cache miss", key=cache_key, generation=generation)
+        return generation, None
+
+    except Exception as e:
+        cache_get_in_progress.dec()
+        logger.error("Cache get error", key=cache_key, error=str(e))
+        return "0", None
+
+
+async def set_raw_namespaced(
+    namespace: str,
+    generation: str,
+    key: str,
+    value: str | bytes,
+    prefix: str = "todo",
+    ttl: int = 3600,
+) -> bool:
+    """
+    Store a payload unless the namespace was invalidated since it was read.
+
+    Args:
+        namespace: Cache namespace guarding the entry
+        generation: Generation returned by the read that missed
+        key: Cache key (without prefix)
+        value: Serialized value to cache
+        prefix: Key prefix
+        ttl: Time to live in seconds
+
+    Returns:
+        True if the payload was stored
+    """
+    script = namespaced_set_script
+
+    if script is None:
+        logger.warning("Redis client is not initialized, skipping cache set")
+        return False
+
+    cache_key = get_key(key, prefix)
+
+    cache_set_in_progress.inc()
+
+    try:
+        stored: int = await script(
+            keys=[get_key(f"{namespace}:generation", prefix), cache_key],
+            args=[generation, ttl, value],
+        )
+        cache_set_in_progress.dec()
+
+        if not stored:
+            logger.debug("Cache set skipped, namespace invalidated", key=cache_key)
+            return False
+
+        logger.debug("Cache set", key=cache_key, ttl=ttl)
+        return True
+
+    except Exception as e:
+        cache_set_in_progress.dec()
+        logger.error("Cache set error", key=cache_key, error=str(e))
+        return False
+
+
+async def invalidate_namespace(namespace: str, *keys: str, prefix: str = "todo") -> bool:
+    """
+    Invalidate a whole namespace plus specific keys in one round-trip.
+
+    Bumps the namespace generation (O(1), no keyspace scan) and deletes the
+    given keys, pipelined. The INCR goes first, so a fill that lands between
+    the two commands is either refused or deleted.
+
+    Args:
+        namespace: Cache namespace to invalidate
+        *keys: Additional keys (without prefix) to delete
+        prefix: Key prefix
+
+    Returns:
+        True if successful
+    """
+    client = redis_client
+
+    if client is None:
+        logger.warning("Redis client is not initialized, skipping invalidate")
+        return False
+
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.incr(get_key(f"{namespace}:generation", prefix))
+            if keys:
+                pipe.unlink(*[get_key(key, prefix) for key in keys])
+            await pipe.execute()
+
+        logger.debug("Invalidated cache namespace", namespace=namespace, keys=keys)
+        return True
+
+    except Exception as e:
+        logger.error("Error invalidating cache namespace", namespace=namespace, error=str(e))
+        return False
@@ -11,18 +11,97 @@ This repository:
 - Uses ORM patterns
 """
 
-from datetime import datetime
+import time
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import bindparam, delete, false, func, not_, select, text, true, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.core.logging import get_logger
 from app.core.metrics import record_db_query
 from app.domain.todo.models import Todo
+from app.domain.todo.schemas import RESPONSE_CACHE_VERSION
+from app.infrastructure.db import invalidate_after_commit
 
 logger = get_logger(__name__)
 
+# List totals are counted exactly up to this many rows; past it the count
+# is capped (or, unfiltered, taken from the planner's estimate) so a large
+# table is never fully scanned just to render a page
+COUNT_LIMIT = 10_000
+
+# Clause objects are immutable, so the ones every listing needs are built
+# once here instead of per request.
+_SORT_COLUMNS = {
+    "created_at": Todo.created_at,
+    "updated_at": Todo.updated_at,
+    "priority": Todo.priority,
+    "title": Todo.title,
+}
+
+# (sort_by, order) -> (sort column, ascending, ORDER BY clauses). id breaks
+# ties so every row has a unique position, which keyset pagination relies on.
+_ORDERINGS = {
+    (sort_by, order): (
+        column,
+        order == "asc",
+        (column.asc(), Todo.id.asc()) if order == "asc" else (column.desc(), Todo.id.desc()),
+    )
+    for sort_by, column in _SORT_COLUMNS.items()
+    for order in ("asc", "desc")
+}
+
+# Default sort by created_at descending
+_DEFAULT_SORT = ("created_at", "desc")
+
+# WHERE clauses keyed by (completion filter or None, filter on priority).
+# The priority value is bound at execution, so each combination is a single
+# statement that SQLAlchemy compiles once and asyncpg prepares once per
+# connection. Completion is a literal instead: once Postgres switches a
+# prepared statement to its generic plan, a bound value can no longer prove
+# the ix_todos_pending predicate (is_completed = false).
+_COMPLETION_FILTERS = {
+    None: (),
+    False: (Todo.is_completed == false(),),
+    True: (Todo.is_completed == true(),),
+}
+_FILTERS = {
+    (completed, by_priority): (
+        *completion_filters,
+        *((Todo.priority == bindparam("priority"),) if by_priority else ()),
+    )
+    for completed, completion_filters in _COMPLETION_FILTERS.items()
+    for by_priority in (False, True)
+}
+
+# Lazy loads raise instead of silently issuing a query per row; callers
+# that need a relationship eager-load it explicitly (see get_all's load).
+# get_by_id applies the same raiseload to session.get().
+_BASE_QUERY = select(Todo).options(raiseload("*"))
+
+# Prebuilt statements for the common requests: first list pages and counts
+_FIRST_PAGES = {
+    (sort, filter_key): _BASE_QUERY.where(*filters)
+    .order_by(*ordering)
+    .limit(bindparam("page_size"))
+    for sort, (_, _, ordering) in _ORDERINGS.items()
+    for filter_key, filters in _FILTERS.items()
+}
+_EXACT_COUNTS = {
+    filter_key: select(func.count(Todo.id)).where(*filters)
+    for filter_key, filters in _FILTERS.items()
+}
+# Counting over a LIMITed id subquery stops the scan at the cap
+_BOUNDED_COUNTS = {
+    filter_key: select(func.count()).select_from(
+        select(Todo.id).where(*filters).limit(bindparam("count_limit")).subquery()
+    )
+    for filter_key, filters in _FILTERS.items()
+}
+
 
 class TodoRepository:
     """Repository for Todo entity."""
@@ -50,12 +129,11 @@ class TodoRepository:
         """
         # BUG #4 FIX: Removed caching because cache returns dict, not Todo object.
         # Querying database directly to always get a proper Todo ORM instance.
-        logger.debug(f"Querying database for todo {id}")
-
-        result = await self.session.execute(select(Todo).where(Todo.id == id))
-        todo = result.scalar_one_or_none()
+        logger.debug("Querying database for todo", todo_id=id)
 
-        return todo
+        # Primary-key lookup: served from the identity map when the todo is
+        # already loaded in this session, without compiling a SELECT
+        return await self.session.get(Todo, id, options=[raiseload("*")])
 
     async def get_all(
         self,
@@ -65,60 +143,118 @@ class TodoRepository:
         order: str = "desc",
         is_completed: bool | None = None,
         priority: str | None = None,
-    ) -> tuple[list[Todo], int]:
+        after: tuple[Any, int] | None = None,
+        exact_count: bool = False,
+        load: Sequence[LoaderOption] = (),
+    ) -> tuple[list[Todo], int, bool]:
         """
         Get all todos with pagination and filtering.
 
+        Pages are fetched with OFFSET unless ``after`` is given, in which case
+        the query seeks past that row instead (keyset pagination), so deep
+        pages cost the same as the first one. OFFSET pages past the first
+        skip rows on ids only and join back for the full rows.
+
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed); ignored when after is given
             page_size: Number of items per page
             sort_by: Field to sort by
             order: Sort order (asc or desc)
             is_completed: Filter by completion status
             priority: Filter by priority
+            after: (sort value, id) of the last row of the previous page
+            exact_count: Count all matching rows even past COUNT_LIMIT
+            load: Eager-loading options (e.g. selectinload) for relationships
+                serialized with the page
 
         Returns:
-            Tuple of (todos list, total count)
+            Tuple of (todos list, total count, whether the total is an estimate)
         """
-        query = select(Todo)
-
         # Apply filters
-        if is_completed is not None:
-            query = query.where(Todo.is_completed == is_completed)
+        filter_key = (is_completed, bool(priority))
+        filters = _FILTERS[filter_key]
+        params: dict[str, Any] = {"priority": priority}
 
-        if priority:
-            query = query.where(Todo.priority == priority)
+        total, estimated = await self._count(filter_key, params, exact_count)
 
         # Apply ordering
-        if sort_by == "priority":
-            query = query.order_by(asc(Todo.priority) if order == "asc" else desc(Todo.priority))
-        elif sort_by in ("created_at", "updated_at"):
-            query = query.order_by(
-                asc(getattr(Todo, sort_by)) if order == "asc" else desc(getattr(Todo, sort_by))
-            )
-        else:
-            # Default sort by created_at descending
-            query = query.order_by(desc(Todo.created_at))
-
-        # BUG #3 FIX: Use SQL COUNT(*) instead of loading all IDs into memory with len(all())
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar()
+        sort = (sort_by, order) if (sort_by, order) in _ORDERINGS else _DEFAULT_SORT
+        sort_column, ascending, ordering = _ORDERINGS[sort]
 
         # Apply pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        if after is None and page <= 1:
+            query = _FIRST_PAGES[(sort, filter_key)].options(*load)
+            params["page_size"] = page_size
+        elif after is not None:
+            position = tuple_(sort_column, Todo.id)
+            seek = position > after if ascending else position < after
+            query = (
+                _BASE_QUERY.options(*load)
+                .where(*filters, seek)
+                .order_by(*ordering)
+                .limit(page_size)
+            )
+        else:
+            # Late row lookup: skip past the offset on the narrow
+            # (sort column, id) index, then fetch full rows for this page only
+            page_ids = (
+                select(Todo.id)
+                .where(*filters)
+                .order_by(*ordering)
+                .offset((page - 1) * page_size)
+                .limit(page_size)
+                .subquery()
+            )
+            query = (
+                _BASE_QUERY.options(*load)
+                .join(page_ids, Todo.id == page_ids.c.id)
+                .order_by(*ordering)
+            )
 
         # Execute query
-        start_time = datetime.now()
-        result = await self.session.execute(query)
+        start = time.perf_counter_ns()
+        result = await self.session.execute(query, params)
         todos = result.scalars().all()
-        duration = (datetime.now() - start_time).total_seconds()
 
         # Record metrics
-        record_db_query("SELECT", "todos", duration)
+        record_db_query("SELECT", "todos", (time.perf_counter_ns() - start) / 1e9)
 
-        return list(todos), total
+        return list(todos), total, estimated
+
+    async def _count(
+        self, filter_key: tuple[bool | None, bool], params: dict[str, Any], exact: bool = False
+    ) -> tuple[int, bool]:
+        """
+        Count todos matching filters, bounded by COUNT_LIMIT unless exact.
+
+        Args:
+            filter_key: Key of the listing's WHERE clauses in _FILTERS
+            params: Filter values
+            exact: Count every matching row
+
+        Returns:
+            Tuple of (count, whether it is an estimate)
+        """
+        # BUG #3 FIX: Use SQL COUNT(*) instead of loading all IDs into memory with len(all())
+        if exact:
+            result = await self.session.execute(_EXACT_COUNTS[filter_key], params)
+            return result.scalar_one(), False
+
+        result = await self.session.execute(
+            _BOUNDED_COUNTS[filter_key], {**params, "count_limit": COUNT_LIMIT + 1}
+        )
+        total: int = result.scalar_one()
+        if total <= COUNT_LIMIT:
+            return total, False
+
+        if filter_key == (None, False):
+            # The planner's row estimate is maintained by ANALYZE/autovacuum
+            result = await self.session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'todos'::regclass")
+            )
+            total = max(result.scalar_one(), COUNT_LIMIT)
+
+        return total, True
 
     async def create(self, todo_data: dict[str, Any]) -> Todo:
         """
@@ -132,20 +268,22 @@ class TodoRepository:
         """
         todo = Todo(**todo_data)
 
+        # id and timestamps come back via RETURNING (eager_defaults on Todo)
         self.session.add(todo)
         await self.session.flush()
-        await self.session.refresh(todo)
 
-        # Clear cache for affected items
-        await self.clear_cache()
+        # A new todo can appear on any list page, but no item key exists yet
+        self.clear_cache()
 
-        logger.info(f"Created todo with ID: {todo.id}")
+        logger.info("Created todo", todo_id=todo.id)
         return todo
 
     async def update(self, id: int, todo_data: dict[str, Any]) -> Todo | None:
         """
         Update todo by ID.
 
+        Issues a single UPDATE ... RETURNING rather than loading the row first.
+
         Args:
             id: Todo ID
             todo_data: Update data dictionary
@@ -153,27 +291,20 @@ class TodoRepository:
         Returns:
             Updated Todo entity or None
         """
-        todo = await self.get_by_id(id)
-        if not todo:
-            return None
+        # BUG #2 FIX: Apply every supplied column, not just collect them.
+        values = {
+            key: value for key, value in todo_data.items() if hasattr(Todo, key) and key != "id"
+        }
+        if not values:
+            return await self.get_by_id(id)
 
-        # BUG #2 FIX: Apply updates directly to the ORM object using setattr.
-        # Previous code collected values into update_data dict but never applied them.
-        has_changes = False
-        for key, value in todo_data.items():
-            if hasattr(todo, key) and key != "id":
-                setattr(todo, key, value)
-                has_changes = True
-
-        if has_changes:
-            todo.updated_at = datetime.now()
-            await self.session.flush()
-            await self.session.refresh(todo)
+        todo = await self._update_returning(id, values)
 
+        if todo is not None:
             # Clear cache for updated item
-            await self.clear_cache()
+            self.clear_cache(id)
 
-            logger.info(f"Updated todo with ID: {id}")
+            logger.info("Updated todo", todo_id=id)
 
         return todo
 
@@ -187,17 +318,16 @@ class TodoRepository:
         Returns:
             True if deleted
         """
-        todo = await self.get_by_id(id)
-        if not todo:
+        result = await self.session.execute(
+            delete(Todo).where(Todo.id == id).returning(Todo.id)
+        )
+        if result.scalar_one_or_none() is None:
             return False
 
-        await self.session.delete(todo)
-        await self.session.flush()
-
         # Clear cache for deleted item
-        await self.clear_cache()
+        self.clear_cache(id)
 
-        logger.info(f"Deleted todo with ID: {id}")
+        logger.info("Deleted todo", todo_id=id)
         return True
 
     async def update_status(self, id: int, is_completed: bool) -> Todo | None:
@@ -211,39 +341,69 @@ class TodoRepository:
         Returns:
             Updated Todo entity or None
         """
-        todo = await self.get_by_id(id)
-        if not todo:
+        todo = await self._update_returning(id, {"is_completed": is_completed})
+        if todo is None:
             return None
 
-        todo.is_completed = is_completed
-        todo.updated_at = datetime.now()
+        # Clear cache
+        self.clear_cache(id)
 
-        await self.session.flush()
-        await self.session.refresh(todo)
+        logger.info("Updated todo status", todo_id=id, is_completed=is_completed)
+        return todo
+
+    async def toggle_status(self, id: int) -> Todo | None:
+        """
+        Flip todo completion status in the database.
+
+        Args:
+            id: Todo ID
+
+        Returns:
+            Updated Todo entity or None
+        """
+        todo = await self._update_returning(id, {"is_completed": not_(Todo.is_completed)})
+        if todo is None:
+            return None
 
         # Clear cache
-        await self.clear_cache()
+        self.clear_cache(id)
 
-        logger.info(f"Updated todo status: {id} -> {is_completed}")
+        logger.info("Toggled todo status", todo_id=id, is_completed=todo.is_completed)
         return todo
 
-    async def clear_cache(self) -> None:
-        """Clear all todo-related cache."""
-        await clear_pattern("todo:*")
-        logger.debug("Cleared todo cache")
-
+    async def _update_returning(self, id: int, values: dict[str, Any]) -> Todo | None:
+        """
+        Apply values to one todo and return the updated row in one round-trip.
 
-# Cache helper function
-async def clear_pattern(pattern: str) -> int:
-    """
-    Clear all keys matching a pattern.
+        Args:
+            id: Todo ID
+            values: Column values to set (updated_at is always bumped)
 
-    Args:
-        pattern: Redis pattern
+        Returns:
+            Updated Todo entity or None if it does not exist
+        """
+        stmt = (
+            update(Todo)
+            .where(Todo.id == id)
+            .values(updated_at=func.now(), **values)
+            .returning(Todo)
+            # Refresh an instance already in the identity map with the new row
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    def clear_cache(self, id: int | None = None) -> None:
+        """
+        Invalidate cached todo reads once the current transaction commits.
 
-    Returns:
-        Number of keys deleted
-    """
-    from app.infrastructure.redis import clear_pattern as redis_clear_pattern
+        Bumps the list-page namespace generation (every cached page becomes
+        unreachable at once) and, when given, deletes the cached item.
+        Must match the keys built in app.api.v1.endpoints.todos.
 
-    return await redis_clear_pattern(pattern)
+        Args:
+            id: ID of the todo that changed
+        """
+        keys = [f"item:v{RESPONSE_CACHE_VERSION}:{id}"] if id is not None else []
+        invalidate_after_commit(self.session, f"list:v{RESPONSE_CACHE_VERSION}", *keys)
+        logger.debug("Scheduled todo cache invalidation")
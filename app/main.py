@@ -12,21 +12,26 @@ This module:
 - Manages application lifecycle
 """
 
+import asyncio
+import logging
+import os
 import time
 from contextlib import asynccontextmanager
 
 import structlog
+from brotli_asgi import BrotliMiddleware
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from prometheus_client import generate_latest
 from app.infrastructure.database import Base
-from app.infrastructure.db import engine
 from app.api.v1.router import api_router
-from app.core.config import settings
-from app.core.lifespan import shutdown_event, startup_event
-from app.core.logging import setup_logging
-from app.core.metrics import record_http_request
+from app.core.config import logging_settings, metrics_settings, settings, tracing_settings
+from app.core.lifespan import get_engine, shutdown_event, startup_event
+from app.core.logging import setup_logging, stop_logging
+from app.core.middleware import MetricsMiddleware
+from app.core.tracing import setup_tracing
 
 # Initialize logging
 setup_logging()
@@ -48,7 +53,7 @@ async def lifespan(_app: FastAPI):
     logger.info("Starting application lifespan")
 
     logger.info("Creating database tables if they don't exist...")
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
     # Startup
@@ -58,6 +63,7 @@ async def lifespan(_app: FastAPI):
     # Shutdown
     await shutdown_event()
     logger.info("Application shutdown complete")
+    stop_logging()
 
 
 # Create FastAPI application
@@ -70,6 +76,7 @@ app = FastAPI(
     openapi_url="/openapi.json",
     lifespan=lifespan,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
 )
 
 # Add middleware
@@ -81,7 +88,52 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Clients that accept br get brotli at quality 4, which encodes JSON faster
+# than gzip and smaller. GZip wraps it for everyone else: it leaves responses
+# that already carry a Content-Encoding alone. Level 5 keeps most of the size
+# reduction of the default 9 for a fraction of the CPU; bodies under 1 KiB
+# gain little from compression.
+app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024, gzip_fallback=False)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+app.add_middleware(MetricsMiddleware)
+
+# At import time, so every uvicorn worker process sets up its own provider
+# and the SQLAlchemy instrumentation is in place before the engine is created
+if tracing_settings.otel_enabled:
+    setup_tracing(app)
+
+
+# Global exception handler
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """
+    Log unhandled exceptions raised by route handlers.
+
+    HTTPException and validation errors keep FastAPI's own handlers; this
+    only sees errors that would otherwise become a bare 500.
+
+    Args:
+        request: HTTP request
+        exc: Unhandled exception
+
+    Returns:
+        500 error response
+    """
+    logger.exception(
+        "Unhandled exception",
+        method=request.method,
+        path=request.url.path,
+        error=str(exc),
+    )
+    return ORJSONResponse(
+        status_code=500,
+        content={"detail": "Internal Server Error"},
+    )
+
+
+# Last rendered metrics body and its time.monotonic() timestamp
+_metrics_cache: tuple[float, bytes] = (float("-inf"), b"")
 
 
 # Metrics endpoint
@@ -90,19 +142,39 @@ async def metrics() -> Response:
     """
     Prometheus metrics endpoint.
 
-    Returns Prometheus-formatted metrics.
+    Returns Prometheus-formatted metrics. Rendering walks every metric, so it
+    runs in a worker thread rather than on the event loop, and the body is
+    reused for metrics_cache_ttl seconds.
 
     Returns:
         Prometheus metrics
     """
+    global _metrics_cache
+
     logger.debug("Metrics request received")
+
+    now = time.monotonic()
+    rendered_at, body = _metrics_cache
+    if now - rendered_at >= metrics_settings.metrics_cache_ttl:
+        body = await asyncio.get_running_loop().run_in_executor(None, generate_latest)
+        _metrics_cache = (now, body)
+
     return Response(
-        content=generate_latest(),
+        content=body,
         media_type="text/plain; version=0.0.4",
         headers={"Content-Type": "text/plain; version=0.0.4"},
     )
 
 
+# Per-request logs are info level; skip building them when that is filtered out
+_LOG_REQUESTS = logging.getLevelName(logging_settings.log_level.upper()) <= logging.INFO
+
+
+def _new_request_id() -> str:
+    """Build a fallback ID, unique across worker processes and restarts."""
+    return os.urandom(8).hex()
+
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next) -> Response:
@@ -116,55 +188,54 @@ async def log_requests(request: Request, call_next) -> Response:
     Returns:
         HTTP response
     """
-    request_id = request.headers.get("X-Request-ID", str(time.time()))
-
-    logger.info(
-        "Request started",
-        request_id=request_id,
-        method=request.method,
-        path=request.url.path,
-        client=request.client.host if request.client else None,
-    )
-
-    start_time = time.time()
-
-    try:
-        response = await call_next(request)
-
-        duration = time.time() - start_time
-        status_code = response.status_code
-
+    method = request.method
+    path = request.url.path
+    # Only log lines use the ID, so the fallback is built when one is written
+    request_id = request.headers.get("X-Request-ID")
+    if request_id is None and _LOG_REQUESTS:
+        request_id = _new_request_id()
+
+    if _LOG_REQUESTS:
         logger.info(
-            "Request completed",
+            "Request started",
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            status_code=status_code,
-            duration=f"{duration:.3f}s",
+            method=method,
+            path=path,
+            client=request.client.host if request.client else None,
         )
 
-        # Record metrics
-        record_http_request(request.method, request.url.path, status_code, duration)
-
-        return response
+    start_time = time.perf_counter()
 
+    try:
+        response = await call_next(request)
     except Exception as e:
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         logger.error(
             "Request failed",
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
+            request_id=request_id or _new_request_id(),
+            method=method,
+            path=path,
             error=str(e),
             duration=f"{duration:.3f}s",
         )
 
-        # Record failed request metric
-        record_http_request(request.method, request.url.path, 500, duration)
-
         raise
 
+    if _LOG_REQUESTS:
+        duration = time.perf_counter() - start_time
+
+        logger.info(
+            "Request completed",
+            request_id=request_id,
+            method=method,
+            path=path,
+            status_code=response.status_code,
+            duration=f"{duration:.3f}s",
+        )
+
+    return response
+
 
 # Include API routers
 app.include_router(api_router, prefix=settings.api_v1_prefix)
@@ -193,8 +264,15 @@ if __name__ == "__main__":
 
     uvicorn.run(
         "app.main:app",
-        host="0.0.0.0",
-        port=8000,
+        host=settings.host,
+        port=settings.port,
         reload=settings.debug,
-        log_level=settings.log_level.lower(),
+        # reload runs a single process; workers only apply without it
+        workers=1 if settings.debug else settings.workers,
+        log_level=logging_settings.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=settings.limit_concurrency,
+        backlog=settings.backlog,
+        timeout_keep_alive=settings.timeout_keep_alive,
     )
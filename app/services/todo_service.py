@@ -11,8 +11,9 @@ The service layer:
 - Handles transactions
 """
 
-from datetime import datetime
+from typing import Any
 
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # BUG #6 FIX: get_priority_order lives in schemas, not config.
@@ -30,6 +31,35 @@ from app.infrastructure.repositories.todo_repository import TodoRepository
 
 logger = get_logger(__name__)
 
+# Histogram children bound once; labels() hashes the label values on every call
+_OPERATION_DURATION = {
+    operation: business_operations_duration_seconds.labels(operation=operation)
+    for operation in (
+        "create_todo",
+        "get_todo",
+        "get_todos",
+        "update_todo",
+        "delete_todo",
+        "toggle_completion",
+    )
+}
+
+
+def _set_fields(data: BaseModel) -> dict[str, Any]:
+    """
+    Get the fields a client actually sent, like model_dump(exclude_unset=True).
+
+    The todo schemas only have scalar fields, so the validated attribute
+    values can be read directly without model_dump's serialization pass.
+
+    Args:
+        data: Validated request body
+
+    Returns:
+        Mapping of set field names to values
+    """
+    return {name: getattr(data, name) for name in data.model_fields_set}
+
 
 class TodoService:
     """Service for Todo operations."""
@@ -54,25 +84,22 @@ class TodoService:
         Returns:
             Created Todo entity
         """
-        start_time = datetime.now()
-
-        logger.info(f"Creating todo: {todo_data.title}")
+        logger.info("Creating todo", title=todo_data.title)
 
-        with business_operations_duration_seconds.labels(operation="create_todo").time():
+        with _OPERATION_DURATION["create_todo"].time():
             # Validate priority order
             priority_order = get_priority_order(todo_data.priority)
-            logger.debug(f"Priority order for '{todo_data.priority}': {priority_order}")
+            logger.debug("Priority order", priority=todo_data.priority, order=priority_order)
 
             # Create todo using repository
-            todo_dict = todo_data.model_dump(exclude_unset=True)
+            todo_dict = _set_fields(todo_data)
             todo = await self.repository.create(todo_dict)
 
             # Record metric
             todos_created_total.inc()
 
-            duration = (datetime.now() - start_time).total_seconds()
             logger.info(
-                f"Todo created successfully in {duration:.3f}s",
+                "Todo created successfully",
                 todo_id=todo.id,
                 priority=todo.priority,
             )
@@ -89,15 +116,12 @@ class TodoService:
         Returns:
             Todo entity or None
         """
-        start_time = datetime.now()
+        logger.debug("Getting todo", todo_id=todo_id)
 
-        logger.debug(f"Getting todo: {todo_id}")
-
-        with business_operations_duration_seconds.labels(operation="get_todo").time():
+        with _OPERATION_DURATION["get_todo"].time():
             todo = await self.repository.get_by_id(todo_id)
 
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"Todo retrieved in {duration:.3f}s", todo_id=todo_id)
+            logger.debug("Todo retrieved", todo_id=todo_id)
 
             return todo
 
@@ -109,23 +133,25 @@ class TodoService:
         order: str = "desc",
         is_completed: bool | None = None,
         priority: str | None = None,
-    ) -> tuple[list[Todo], int]:
+        after: tuple[Any, int] | None = None,
+        exact_count: bool = False,
+    ) -> tuple[list[Todo], int, bool]:
         """
         Get all todos with filtering and pagination.
 
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed); ignored when after is given
             page_size: Number of items per page
             sort_by: Field to sort by
             order: Sort order (asc or desc)
             is_completed: Filter by completion status
             priority: Filter by priority
+            after: (sort value, id) of the last todo on the previous page
+            exact_count: Count all matching todos instead of a bounded count
 
         Returns:
-            Tuple of (todos list, total count)
+            Tuple of (todos list, total count, whether the total is an estimate)
         """
-        start_time = datetime.now()
-
         logger.info(
             "Fetching todos",
             page=page,
@@ -136,24 +162,21 @@ class TodoService:
             priority=priority,
         )
 
-        with business_operations_duration_seconds.labels(operation="get_todos").time():
-            todos, total = await self.repository.get_all(
+        with _OPERATION_DURATION["get_todos"].time():
+            todos, total, estimated = await self.repository.get_all(
                 page=page,
                 page_size=page_size,
                 sort_by=sort_by,
                 order=order,
                 is_completed=is_completed,
                 priority=priority,
+                after=after,
+                exact_count=exact_count,
             )
 
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.info(
-                f"Todos fetched successfully in {duration:.3f}s",
-                total=total,
-                returned=len(todos),
-            )
+            logger.info("Todos fetched successfully", total=total, returned=len(todos))
 
-            return todos, total
+            return todos, total, estimated
 
     async def update_todo(self, todo_id: int, todo_data: TodoUpdate) -> Todo | None:
         """
@@ -166,22 +189,16 @@ class TodoService:
         Returns:
             Updated Todo entity or None
         """
-        start_time = datetime.now()
+        logger.info("Updating todo", todo_id=todo_id)
 
-        logger.info(f"Updating todo: {todo_id}")
-
-        with business_operations_duration_seconds.labels(operation="update_todo").time():
-            todo_dict = todo_data.model_dump(exclude_unset=True)
+        with _OPERATION_DURATION["update_todo"].time():
+            todo_dict = _set_fields(todo_data)
             updated_todo = await self.repository.update(todo_id, todo_dict)
 
             if updated_todo:
                 todos_updated_total.inc()
 
-                duration = (datetime.now() - start_time).total_seconds()
-                logger.info(
-                    f"Todo updated successfully in {duration:.3f}s",
-                    todo_id=todo_id,
-                )
+                logger.info("Todo updated successfully", todo_id=todo_id)
 
             return updated_todo
 
@@ -195,18 +212,15 @@ class TodoService:
         Returns:
             True if deleted
         """
-        start_time = datetime.now()
-
-        logger.info(f"Deleting todo: {todo_id}")
+        logger.info("Deleting todo", todo_id=todo_id)
 
-        with business_operations_duration_seconds.labels(operation="delete_todo").time():
+        with _OPERATION_DURATION["delete_todo"].time():
             deleted = await self.repository.delete(todo_id)
 
             if deleted:
                 todos_deleted_total.inc()
 
-                duration = (datetime.now() - start_time).total_seconds()
-                logger.info(f"Todo deleted successfully in {duration:.3f}s", todo_id=todo_id)
+                logger.info("Todo deleted successfully", todo_id=todo_id)
 
             return deleted
 
@@ -220,29 +234,23 @@ class TodoService:
         Returns:
             Updated Todo entity or None
         """
-        start_time = datetime.now()
+        logger.info("Toggling todo completion", todo_id=todo_id)
 
-        logger.info(f"Toggling todo completion: {todo_id}")
-
-        with business_operations_duration_seconds.labels(operation="toggle_completion").time():
-            todo = await self.repository.get_by_id(todo_id)
-            if not todo:
+        with _OPERATION_DURATION["toggle_completion"].time():
+            # Flipped by a single UPDATE ... RETURNING, no read beforehand
+            updated_todo = await self.repository.toggle_status(todo_id)
+            if not updated_todo:
                 return None
 
-            # Toggle status
-            new_status = not todo.is_completed
-            updated_todo = await self.repository.update_status(todo_id, new_status)
-
-            if updated_todo:
-                if new_status:
-                    todos_completed_total.inc()
-                    logger.info(f"Todo marked as completed: {todo_id}")
-                else:
-                    logger.info(f"Todo marked as incomplete: {todo_id}")
+            new_status = updated_todo.is_completed
+            if new_status:
+                todos_completed_total.inc()
+                logger.info("Todo marked as completed", todo_id=todo_id)
+            else:
+                logger.info("Todo marked as incomplete", todo_id=todo_id)
 
-            duration = (datetime.now() - start_time).total_seconds()
             logger.info(
-                f"Todo completion toggled successfully in {duration:.3f}s",
+                "Todo completion toggled successfully",
                 todo_id=todo_id,
                 new_status=new_status,
             )
@@ -10,15 +10,23 @@ CREATE TABLE IF NOT EXISTS todos (
     title VARCHAR(255) NOT NULL,
     description VARCHAR(1000),
     is_completed BOOLEAN NOT NULL DEFAULT FALSE,
-    priority VARCHAR(20) NOT NULL DEFAULT 'medium',
+    -- 1 = low, 2 = medium, 3 = high (see app.domain.todo.models.PriorityType)
+    priority SMALLINT NOT NULL DEFAULT 2,
     created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Create indexes for better performance
-CREATE INDEX IF NOT EXISTS idx_todos_created_at ON todos(created_at DESC);
-CREATE INDEX IF NOT EXISTS idx_todos_is_completed ON todos(is_completed);
-CREATE INDEX IF NOT EXISTS idx_todos_priority ON todos(priority);
+-- (names match the indexes declared on app.domain.todo.models.Todo)
+CREATE INDEX IF NOT EXISTS ix_todos_created_at ON todos(created_at, id);
+CREATE INDEX IF NOT EXISTS ix_todos_priority ON todos(priority, id);
+CREATE INDEX IF NOT EXISTS ix_todos_completed_priority_created
+    ON todos(is_completed, priority, created_at);
+CREATE INDEX IF NOT EXISTS ix_todos_priority_created ON todos(priority, created_at, id);
+-- Replaces ix_todos_active, which lacked the id tiebreaker
+DROP INDEX IF EXISTS ix_todos_active;
+CREATE INDEX IF NOT EXISTS ix_todos_pending
+    ON todos(created_at, id) WHERE is_completed = false;
 
 -- Create function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -41,7 +49,7 @@ SELECT
     'Welcome to Todo API',
     'This is a sample todo. Feel free to add, update, or delete todos through the API.',
     FALSE,
-    'medium'
+    2
 WHERE NOT EXISTS (SELECT 1 FROM todos LIMIT 1);
 
 -- Grant permissions (adjust as needed for production)
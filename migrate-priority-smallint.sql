@@ -0,0 +1,36 @@
+-- Upgrade: store todos.priority as its SMALLINT rank
+-- ==================================================
+--
+-- init-db.sql only runs on an empty data volume. Databases created while
+-- priority was VARCHAR(20) ('low' / 'medium' / 'high') need this once:
+--
+--   docker compose exec -T postgres psql -U todo_user -d todo_db < migrate-priority-smallint.sql
+--
+-- Safe to re-run: it does nothing once the column is SMALLINT. An unknown
+-- priority value fails the NOT NULL check and leaves the table unchanged.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'todos'
+          AND column_name = 'priority'
+          AND data_type = 'character varying'
+    ) THEN
+        -- The old 'medium' default cannot be cast to the new type
+        ALTER TABLE todos ALTER COLUMN priority DROP DEFAULT;
+
+        -- 1 = low, 2 = medium, 3 = high (see app.domain.todo.models.PriorityType);
+        -- indexes on the column are rebuilt as part of the rewrite
+        ALTER TABLE todos ALTER COLUMN priority TYPE SMALLINT USING CASE priority
+            WHEN 'low' THEN 1
+            WHEN 'medium' THEN 2
+            WHEN 'high' THEN 3
+        END;
+
+        ALTER TABLE todos ALTER COLUMN priority SET DEFAULT 2;
+    END IF;
+END
+$$;
@@ -1 +1,6 @@
 # tests/__init__.py
+import os
+
+# Imported before conftest loads the app: keep tracing (its exporters and
+# SQLAlchemy / Redis instrumentation) out of the suite unless asked for
+os.environ.setdefault("OTEL_ENABLED", "false")
@@ -5,21 +5,27 @@ Main Application Tests
 Tests for application entry point and middleware.
 """
 
-import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-
-@pytest.fixture
-def client() -> TestClient:
-    """Create test client for FastAPI application."""
-    return TestClient(app)
-
+from collections.abc import Generator
 
-def test_root(client: TestClient) -> None:
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from opentelemetry import trace
+from opentelemetry.instrumentation.redis import RedisInstrumentor
+from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from prometheus_client import REGISTRY
+
+from app.core import tracing
+from app.core.config import metrics_settings, tracing_settings
+
+
+@pytest.mark.asyncio
+async def test_root(http_client: AsyncClient) -> None:
     """Test root endpoint."""
-    response = client.get("/")
+    response = await http_client.get("/")
 
     assert response.status_code == 200
     data = response.json()
@@ -32,9 +38,10 @@ def test_root(client: TestClient) -> None:
     assert "health" in data
 
 
-def test_health_check(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_health_check(http_client: AsyncClient) -> None:
     """Test health check endpoint."""
-    response = client.get("/api/v1/health")
+    response = await http_client.get("/api/v1/health")
 
     assert response.status_code == 200
     data = response.json()
@@ -44,18 +51,56 @@ def test_health_check(client: TestClient) -> None:
     assert "timestamp" in data
 
 
-def test_metrics_endpoint(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_metrics_endpoint(http_client: AsyncClient) -> None:
     """Test metrics endpoint."""
-    response = client.get("/metrics")
+    response = await http_client.get("/metrics")
 
     assert response.status_code == 200
     assert response.headers["content-type"] == "text/plain; version=0.0.4"
     assert response.text.startswith("# HELP")
 
 
-def test_openapi_endpoint(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_metrics_endpoint_aggregates_counters(
+    http_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that sharded counters are summed and exposed under their names."""
+    monkeypatch.setattr(metrics_settings, "metrics_cache_ttl", 0)
+    await http_client.get("/")
+    await http_client.get("/")
+    response = await http_client.get("/metrics")
+
+    assert "# TYPE http_requests_total counter" in response.text
+    assert 'endpoint="/",method="GET",status_code="200"' in response.text
+    assert 'cache_result_total{result="hit"}' in response.text
+
+
+@pytest.mark.asyncio
+async def test_requests_in_progress_returns_to_zero(http_client: AsyncClient) -> None:
+    """Test that the in-progress gauge is raised for a request and lowered after it."""
+    await http_client.get("/")
+
+    assert REGISTRY.get_sample_value("http_requests_in_progress", {"method": "GET"}) == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reuses_rendered_body(
+    http_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that scrapes within metrics_cache_ttl share one rendering."""
+    monkeypatch.setattr(metrics_settings, "metrics_cache_ttl", 60)
+    first = await http_client.get("/metrics")
+    await http_client.get("/")
+    second = await http_client.get("/metrics")
+
+    assert second.text == first.text
+
+
+@pytest.mark.asyncio
+async def test_openapi_endpoint(http_client: AsyncClient) -> None:
     """Test OpenAPI schema endpoint."""
-    response = client.get("/openapi.json")
+    response = await http_client.get("/openapi.json")
 
     assert response.status_code == 200
     data = response.json()
@@ -68,32 +113,86 @@ def test_openapi_endpoint(client: TestClient) -> None:
     assert data["info"]["version"] == "0.1.0"
 
 
-def test_docs_endpoint(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_docs_endpoint(http_client: AsyncClient) -> None:
     """Test API documentation endpoint."""
-    response = client.get("/docs")
+    response = await http_client.get("/docs")
 
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
 
 
-def test_redoc_endpoint(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_redoc_endpoint(http_client: AsyncClient) -> None:
     """Test alternative documentation endpoint."""
-    response = client.get("/redoc")
+    response = await http_client.get("/redoc")
 
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
 
 
-def test_not_found(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_not_found(http_client: AsyncClient) -> None:
     """Test 404 for non-existent endpoint."""
-    response = client.get("/nonexistent")
+    response = await http_client.get("/nonexistent")
 
     assert response.status_code == 404
 
 
-def test_method_not_allowed(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_method_not_allowed(http_client: AsyncClient) -> None:
     """Test 405 for wrong HTTP method on health endpoint (no DB needed)."""
     # POST is not registered on /api/v1/health — only GET is
-    response = client.post("/api/v1/health")
+    response = await http_client.post("/api/v1/health")
+
+    assert response.status_code == 405
+
+
+@pytest.fixture
+def tracer_provider(monkeypatch: pytest.MonkeyPatch) -> Generator[TracerProvider, None, None]:
+    """
+    Run setup_tracing on a throwaway app as in production, without instrumentation.
+
+    Yields:
+        The tracer provider it installed
+    """
+    providers: list[TracerProvider] = []
+    monkeypatch.setattr(trace, "set_tracer_provider", providers.append)
+    monkeypatch.delenv("OTEL_TRACES_SAMPLER", raising=False)
+    monkeypatch.setattr(tracing_settings, "otel_enabled", True)
+    monkeypatch.setattr(tracing_settings, "otel_environment", "production")
+    monkeypatch.setattr(tracing_settings, "otel_sampling_rate", 0.25)
+    monkeypatch.setattr(tracing_settings, "otel_instrument_sqlalchemy", False)
+    monkeypatch.setattr(tracing_settings, "otel_instrument_redis", False)
+
+    tracing.setup_tracing(FastAPI())
+
+    yield providers[0]
+
+    providers[0].shutdown()
+
+
+def test_setup_tracing_samples_by_trace_id(tracer_provider: TracerProvider) -> None:
+    """Test that root spans are sampled by trace ID ratio and children follow their parent."""
+    sampler = tracer_provider.sampler
+
+    assert isinstance(sampler, ParentBased)
+    assert isinstance(sampler._root, TraceIdRatioBased)
+    assert sampler._root.rate == 0.25
+
+
+def test_setup_tracing_tunes_batch_span_processor(tracer_provider: TracerProvider) -> None:
+    """Test that the otel_bsp_* settings (not the SDK defaults) reach the BatchSpanProcessor."""
+    (processor,) = tracer_provider._active_span_processor._span_processors
+
+    assert isinstance(processor, BatchSpanProcessor)
+    assert processor.max_queue_size == tracing_settings.otel_bsp_max_queue_size
+    assert processor.schedule_delay_millis == tracing_settings.otel_bsp_schedule_delay
+    assert processor.max_export_batch_size == tracing_settings.otel_bsp_max_export_batch_size
+    assert processor.export_timeout_millis == tracing_settings.otel_bsp_export_timeout
+
 
-    assert response.status_code == 405
\ No newline at end of file
+def test_setup_tracing_skips_disabled_instrumentation(tracer_provider: TracerProvider) -> None:
+    """Test that otel_instrument_sqlalchemy / otel_instrument_redis off install nothing."""
+    assert not SQLAlchemyInstrumentor().is_instrumented_by_opentelemetry
+    assert not RedisInstrumentor().is_instrumented_by_opentelemetry
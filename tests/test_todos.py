@@ -8,10 +8,16 @@ Integration tests for todo endpoints.
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from prometheus_client import REGISTRY
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.todo.models import Todo
+from app.domain.todo.schemas import RESPONSE_CACHE_VERSION
+from app.infrastructure import redis as cache
+from app.infrastructure.db import flush_cache_invalidations
+from app.infrastructure.repositories import todo_repository
 
 
 @pytest.mark.asyncio
@@ -121,18 +127,13 @@ async def test_list_todos(client: AsyncClient, test_todo: dict) -> None:
 
 
 @pytest.mark.asyncio
-async def test_list_todos_pagination(client: AsyncClient) -> None:
+async def test_list_todos_pagination(client: AsyncClient, test_db_session: AsyncSession) -> None:
     """Test listing todos with pagination."""
-    # Create multiple todos
-    for i in range(5):
-        await client.post(
-            "/api/v1/todos",
-            json={
-                "title": f"Todo {i}",
-                "is_completed": False,
-                "priority": "medium",
-            },
-        )
+    # Seed with one executemany INSERT rather than a request per todo
+    await test_db_session.execute(
+        insert(Todo),
+        [{"title": f"Todo {i}", "is_completed": False, "priority": "medium"} for i in range(5)],
+    )
 
     # Test page 1
     response = await client.get("/api/v1/todos?page=1&page_size=2")
@@ -154,6 +155,37 @@ async def test_list_todos_pagination(client: AsyncClient) -> None:
     assert data["page"] == 2
 
 
+@pytest.mark.asyncio
+async def test_list_todos_gzip(client: AsyncClient) -> None:
+    """Test that large list responses are gzip-compressed."""
+    for i in range(5):
+        await client.post(
+            "/api/v1/todos",
+            json={"title": f"Todo {i}", "description": "x" * 500, "priority": "medium"},
+        )
+
+    response = await client.get("/api/v1/todos", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(response.json()["items"]) >= 5
+
+
+@pytest.mark.asyncio
+async def test_list_todos_brotli(client: AsyncClient) -> None:
+    """Test that clients accepting br get brotli instead of gzip."""
+    for i in range(5):
+        await client.post(
+            "/api/v1/todos",
+            json={"title": f"Todo {i}", "description": "x" * 500, "priority": "medium"},
+        )
+
+    response = await client.get("/api/v1/todos", headers={"Accept-Encoding": "br, gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "br"
+    assert len(response.json()["items"]) >= 5
+
+
 @pytest.mark.asyncio
 async def test_list_todos_filter_completed(client: AsyncClient, _test_completed_todo: dict) -> None:
     """Test listing todos with completion filter."""
@@ -182,6 +214,126 @@ async def test_list_todos_filter_completed(client: AsyncClient, _test_completed_
     assert all(not todo["is_completed"] for todo in data["items"])
 
 
+def test_pending_filter_is_literal() -> None:
+    """Test that the pending filter is inlined, so generic plans can still use ix_todos_pending."""
+    statement = todo_repository._FIRST_PAGES[(("created_at", "desc"), (False, False))]
+    compiled = statement.compile(dialect=postgresql.asyncpg.dialect())
+
+    assert "todos.is_completed = false" in str(compiled)
+    assert "is_completed" not in compiled.params
+
+
+@pytest.mark.asyncio
+async def test_list_todos_offset_page_matches_full_list(client: AsyncClient) -> None:
+    """Test that a later OFFSET page holds the same rows as the full listing."""
+    for priority in ("low", "high", "medium", "high", "low"):
+        await client.post("/api/v1/todos", json={"title": priority, "priority": priority})
+
+    for query in ("", "&sort_by=priority&order=asc"):
+        full = (await client.get(f"/api/v1/todos?page_size=10{query}")).json()["items"]
+        page = (await client.get(f"/api/v1/todos?page=2&page_size=2{query}")).json()["items"]
+        assert [todo["id"] for todo in page] == [todo["id"] for todo in full[2:4]]
+
+
+@pytest.mark.asyncio
+async def test_list_todos_cursor_pagination(client: AsyncClient) -> None:
+    """Test walking all todos with keyset cursors, including sort ties."""
+    for i in range(5):
+        await client.post("/api/v1/todos", json={"title": f"Todo {i}", "priority": "medium"})
+
+    for query in ("", "&sort_by=priority&order=asc"):
+        response = await client.get(f"/api/v1/todos?page_size=2{query}")
+        data = response.json()
+        seen = [todo["id"] for todo in data["items"]]
+
+        while data["next_cursor"]:
+            response = await client.get(
+                f"/api/v1/todos?page_size=2{query}&cursor={data['next_cursor']}"
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["has_previous"] is True
+            seen += [todo["id"] for todo in data["items"]]
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_list_todos_invalid_cursor(client: AsyncClient) -> None:
+    """Test listing todos with a malformed cursor (should fail)."""
+    response = await client.get("/api/v1/todos?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_todos_bounded_count(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that totals past COUNT_LIMIT are capped unless exact_count is set."""
+    monkeypatch.setattr(todo_repository, "COUNT_LIMIT", 2)
+    for i in range(4):
+        await client.post("/api/v1/todos", json={"title": f"Todo {i}", "priority": "low"})
+
+    for query in ("", "?priority=low"):
+        data = (await client.get(f"/api/v1/todos{query}")).json()
+        assert data["total_is_estimate"] is True
+        assert data["total"] >= 2
+        assert len(data["items"]) == 4
+
+    data = (await client.get("/api/v1/todos?exact_count=true")).json()
+    assert data["total_is_estimate"] is False
+    assert data["total"] == 4
+
+
+@pytest.mark.asyncio
+async def test_list_todos_query_count(
+    client: AsyncClient, test_todo: dict, query_counter: list[str]
+) -> None:
+    """Test that a list page costs a count and a select, however many rows."""
+    await client.post("/api/v1/todos", json={"title": "Second", "priority": "low"})
+    query_counter.clear()
+
+    response = await client.get("/api/v1/todos")
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 2
+    assert 0 < len(query_counter) <= 2
+
+
+@pytest.mark.asyncio
+async def test_list_todos_sort_by_title(client: AsyncClient) -> None:
+    """Test listing todos sorted by title."""
+    for title in ("Bravo", "Alpha", "Charlie"):
+        await client.post("/api/v1/todos", json={"title": title, "priority": "medium"})
+
+    response = await client.get("/api/v1/todos?sort_by=title&order=asc")
+    assert response.status_code == 200
+
+    titles = [todo["title"] for todo in response.json()["items"]]
+    assert titles == sorted(titles)
+
+
+@pytest.mark.asyncio
+async def test_list_todos_sort_by_priority(client: AsyncClient) -> None:
+    """Test listing todos sorted by priority rank, not alphabetically."""
+    for priority in ("medium", "high", "low"):
+        await client.post("/api/v1/todos", json={"title": priority, "priority": priority})
+
+    response = await client.get("/api/v1/todos?sort_by=priority&order=desc")
+    assert response.status_code == 200
+
+    priorities = [todo["priority"] for todo in response.json()["items"]]
+    assert priorities == ["high", "medium", "low"]
+
+
+@pytest.mark.asyncio
+async def test_list_todos_invalid_query_params(client: AsyncClient) -> None:
+    """Test listing todos with unsupported sort/filter values (should fail)."""
+    for query in ("sort_by=description", "order=sideways", "priority=urgent"):
+        response = await client.get(f"/api/v1/todos?{query}")
+        assert response.status_code == 422  # Validation error
+
+
 @pytest.mark.asyncio
 async def test_update_todo(client: AsyncClient, test_todo: dict) -> None:
     """Test updating a todo."""
@@ -324,4 +476,104 @@ async def test_rate_limiting(client: AsyncClient) -> None:
         responses.append(response.status_code)
 
     # Should not be rate limited (default limit is 100 per 60 seconds)
-    assert all(code in (200, 404, 405) for code in responses)
\ No newline at end of file
+    assert all(code in (200, 404, 405) for code in responses)
+
+
+@pytest.mark.asyncio
+async def test_get_todo_served_from_cache(
+    client: AsyncClient, test_todo: dict, redis_cache: None
+) -> None:
+    """Test that repeated reads hit the cache and updates invalidate it."""
+    todo_id = test_todo["id"]
+
+    first = await client.get(f"/api/v1/todos/{todo_id}")
+    assert first.status_code == 200
+
+    hits_before = REGISTRY.get_sample_value("cache_result_total", {"result": "hit"})
+    second = await client.get(f"/api/v1/todos/{todo_id}")
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert REGISTRY.get_sample_value("cache_result_total", {"result": "hit"}) == hits_before + 1
+
+    # Updating must invalidate the cached copy
+    await client.put(f"/api/v1/todos/{todo_id}", json={"title": "After Cache"})
+
+    third = await client.get(f"/api/v1/todos/{todo_id}")
+    assert third.json()["title"] == "After Cache"
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidated_after_commit(
+    client: AsyncClient, test_db_session: AsyncSession, test_todo: dict, redis_cache: None
+) -> None:
+    """Test that a read between a write's flush and its commit cannot leave a stale entry."""
+    todo_id = test_todo["id"]
+    stale = await client.get(f"/api/v1/todos/{todo_id}")
+
+    # The write is flushed, but not yet committed
+    await todo_repository.TodoRepository(test_db_session).update(todo_id, {"title": "Committed"})
+
+    # A concurrent GET still sees the old committed row and refills the cache
+    await cache.set_raw(f"item:v{RESPONSE_CACHE_VERSION}:{todo_id}", stale.content)
+
+    await test_db_session.commit()
+    await flush_cache_invalidations(test_db_session)
+
+    response = await client.get(f"/api/v1/todos/{todo_id}")
+    assert response.json()["title"] == "Committed"
+
+
+@pytest.mark.asyncio
+async def test_cache_fill_refused_after_invalidation(redis_cache: None) -> None:
+    """Test that a fill read before an invalidation is not stored."""
+    namespace = f"list:v{RESPONSE_CACHE_VERSION}"
+    key = f"item:v{RESPONSE_CACHE_VERSION}:0"
+    generation, cached = await cache.get_raw_with_generation(namespace, key)
+    assert cached is None
+
+    await cache.invalidate_namespace(namespace, key)
+
+    assert not await cache.set_raw_namespaced(namespace, generation, key, b"stale")
+    assert (await cache.get_raw_with_generation(namespace, key))[1] is None
+
+    generation, _ = await cache.get_raw_with_generation(namespace, key)
+    assert await cache.set_raw_namespaced(namespace, generation, key, b"fresh")
+
+
+@pytest.mark.asyncio
+async def test_list_todos_cache_invalidated_on_create(
+    client: AsyncClient, test_todo: dict, redis_cache: None
+) -> None:
+    """Test that list pages are cached and creating a todo drops them."""
+    first = await client.get("/api/v1/todos")
+    assert first.status_code == 200
+
+    hits_before = REGISTRY.get_sample_value("cache_result_total", {"result": "hit"})
+    cached = await client.get("/api/v1/todos")
+    assert cached.json() == first.json()
+    assert REGISTRY.get_sample_value("cache_result_total", {"result": "hit"}) == hits_before + 1
+
+    await client.post("/api/v1/todos", json={"title": "Another Todo", "priority": "low"})
+
+    second = await client.get("/api/v1/todos")
+    assert second.json()["total"] == first.json()["total"] + 1
+
+
+@pytest.mark.asyncio
+async def test_get_todo_etag_not_modified(client: AsyncClient, test_todo: dict) -> None:
+    """Test that a matching If-None-Match returns 304 and a change returns 200."""
+    todo_id = test_todo["id"]
+
+    first = await client.get(f"/api/v1/todos/{todo_id}")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    not_modified = await client.get(f"/api/v1/todos/{todo_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    await client.put(f"/api/v1/todos/{todo_id}", json={"title": "Changed"})
+
+    changed = await client.get(f"/api/v1/todos/{todo_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag